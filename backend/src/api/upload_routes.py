@@ -352,7 +352,7 @@ async def index_db(
 ):
     """
     Create indexes on MongoDB collections for optimal search performance.
-    Creates indexes on 'en', 'ru', and 'seq_id' fields for the pairs collection.
+    Creates indexes on 'en', 'ru', 'seq_id' and 'file_en' fields for the pairs collection.
     Requires admin role.
     """
     try:
@@ -363,6 +363,7 @@ async def index_db(
         await collection.create_index([("en", 1)], name="en_index")
         await collection.create_index([("ru", 1)], name="ru_index")
         await collection.create_index([("seq_id", 1)], name="seq_id_idx", unique=True, sparse=True)
+        await collection.create_index([("file_en", 1)], name="file_en_idx")
 
         # Get collection stats
         total = await repo.count_total()
@@ -374,7 +375,7 @@ async def index_db(
         return {
             "message": "Database indexed successfully",
             "total_docs": total,
-            "indexes_created": ["en_index", "ru_index", "seq_id_idx"],
+            "indexes_created": ["en_index", "ru_index", "seq_id_idx", "file_en_idx"],
             "all_indexes": index_names
         }
     except Exception as e:
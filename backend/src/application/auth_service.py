@@ -26,13 +26,14 @@ class AuthService:
 
     async def signup(self, dto: SignupDTO) -> TokenResponseDTO:
         """Register a new user and return token."""
-        # Check if user already exists
-        existing_email = await self.user_repository.get_by_email(dto.email.lower())
-        if existing_email:
+        # Check if user already exists (email and username in one query)
+        _, email_taken, username_taken = await self.user_repository.exists_any(
+            email=dto.email.lower(),
+            username=dto.username
+        )
+        if email_taken:
             raise ValueError("Email already registered")
-
-        existing_username = await self.user_repository.get_by_username(dto.username)
-        if existing_username:
+        if username_taken:
             raise ValueError("Username already taken")
 
         # Hash password
@@ -1,6 +1,7 @@
 """Application service for subtitle pair operations."""
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
+import time
 
 from domain.entities import SubtitlePair, Idiom, IdiomLike, Quote, SystemStats, User
 from domain.interfaces import (
@@ -24,6 +25,19 @@ from application.dto import (
 )
 
 
+# Stats snapshot shared across requests (the service is built per request).
+# Stats only change through compute_stats, delete_all_pairs and
+# clear_duplicates, which invalidate it; the TTL bounds staleness otherwise.
+STATS_CACHE_TTL_SECONDS = 30.0
+_stats_cache: Optional[Tuple[float, StatsResponseDTO]] = None
+
+
+def invalidate_stats_cache() -> None:
+    """Drop the cached stats so the next get_stats reads from the repository."""
+    global _stats_cache
+    _stats_cache = None
+
+
 class SubtitlePairService:
     """Service layer for subtitle pair business logic."""
 
@@ -155,6 +169,7 @@ class SubtitlePairService:
     async def delete_all_pairs(self) -> DeleteResponseDTO:
         """Delete all pairs."""
         deleted = await self.pair_repo.delete_all()
+        invalidate_stats_cache()
         if self.search_engine:
             await self.search_engine.delete_all_indices()
         return DeleteResponseDTO(
@@ -165,6 +180,7 @@ class SubtitlePairService:
     async def clear_duplicates(self) -> ClearDuplicatesResponseDTO:
         """Remove duplicate pairs."""
         deleted = await self.pair_repo.clear_duplicates()
+        invalidate_stats_cache()
         return ClearDuplicatesResponseDTO(
             duplicate_groups=deleted,
             documents_deleted=deleted,
@@ -172,15 +188,23 @@ class SubtitlePairService:
         )
 
     async def get_stats(self) -> StatsResponseDTO:
-        """Get system statistics."""
+        """Get system statistics (cached for STATS_CACHE_TTL_SECONDS)."""
+        global _stats_cache
+        now = time.monotonic()
+        if _stats_cache is not None and _stats_cache[0] > now:
+            return _stats_cache[1]
+
         stats = await self.stats_repo.get_latest()
         if not stats:
-            return StatsResponseDTO(total=0, files_en=[])
-        return StatsResponseDTO(
-            total=stats.total,
-            files_en=stats.files_en,
-            updated_at=stats.updated_at
-        )
+            result = StatsResponseDTO(total=0, files_en=[])
+        else:
+            result = StatsResponseDTO(
+                total=stats.total,
+                files_en=stats.files_en,
+                updated_at=stats.updated_at
+            )
+        _stats_cache = (now + STATS_CACHE_TTL_SECONDS, result)
+        return result
 
     async def compute_stats(self) -> StatsResponseDTO:
         """Compute and save statistics."""
@@ -192,6 +216,7 @@ class SubtitlePairService:
             updated_at=datetime.utcnow().isoformat() + "Z"
         )
         await self.stats_repo.save(stats)
+        invalidate_stats_cache()
         return StatsResponseDTO(
             total=stats.total,
             files_en=stats.files_en,
@@ -1,6 +1,6 @@
 """Repository interfaces - abstractions for data access."""
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from .entities import SubtitlePair, User, Idiom, IdiomLike, Quote, SystemStats
 
 
@@ -39,7 +39,7 @@ class ISubtitlePairRepository(ABC):
 
     @abstractmethod
     async def create_many(self, pairs: List[SubtitlePair]) -> int:
-        """Create many subtitle pairs. Returns count inserted."""
+        """Create many subtitle pairs, setting id on each inserted pair. Returns count inserted."""
         pass
 
     @abstractmethod
@@ -213,6 +213,11 @@ class IQuoteRepository(ABC):
         """Insert or update quote."""
         pass
 
+    @abstractmethod
+    async def upsert_many(self, quotes: List[Quote]) -> int:
+        """Insert or update many quotes. Returns count written."""
+        pass
+
 
 class IStatsRepository(ABC):
     """Abstract repository interface for SystemStats."""
@@ -246,6 +251,16 @@ class IUserRepository(ABC):
         """Retrieve a user by username."""
         pass
 
+    @abstractmethod
+    async def exists_any(
+        self,
+        user_id: Optional[str] = None,
+        email: Optional[str] = None,
+        username: Optional[str] = None
+    ) -> Tuple[bool, bool, bool]:
+        """Check in one query whether a user with the given id, email, username exists."""
+        pass
+
     @abstractmethod
     async def create(self, user: User) -> User:
         """Create a new user."""
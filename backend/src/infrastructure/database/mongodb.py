@@ -1,5 +1,5 @@
 """MongoDB implementation of repository."""
-from typing import Optional
+from typing import Optional, Tuple
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from datetime import datetime
 
@@ -86,6 +86,32 @@ class MongoDBUserRepository(IUserRepository):
         document = await self.collection.find_one({"username": username})
         return self._document_to_entity(document) if document else None
 
+    async def exists_any(
+        self,
+        user_id: Optional[str] = None,
+        email: Optional[str] = None,
+        username: Optional[str] = None
+    ) -> Tuple[bool, bool, bool]:
+        """Check in one query whether a user with the given id, email, username exists."""
+        email = email.lower() if email else email
+        clauses = []
+        if user_id is not None:
+            clauses.append({"_id": user_id})
+        if email is not None:
+            clauses.append({"email": email})
+        if username is not None:
+            clauses.append({"username": username})
+        if not clauses:
+            return False, False, False
+
+        cursor = self.collection.find({"$or": clauses}, {"_id": 1, "email": 1, "username": 1})
+        found_id = found_email = found_username = False
+        async for doc in cursor:
+            found_id = found_id or (user_id is not None and doc.get("_id") == user_id)
+            found_email = found_email or (email is not None and doc.get("email") == email)
+            found_username = found_username or (username is not None and doc.get("username") == username)
+        return found_id, found_email, found_username
+
     async def create(self, user: User) -> User:
         """Create a new user."""
         document = self._entity_to_document(user)
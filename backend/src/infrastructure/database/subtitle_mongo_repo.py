@@ -4,6 +4,8 @@ import random
 import re
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
+from pymongo import DeleteMany, UpdateOne
+from pymongo.errors import BulkWriteError
 from datetime import datetime
 
 from domain.entities import SubtitlePair, Idiom, Quote, SystemStats
@@ -14,6 +16,8 @@ from domain.interfaces import (
     IStatsRepository
 )
 
+DUPLICATE_KEY_ERROR = 11000
+
 
 class MongoDBSubtitlePairRepository(ISubtitlePairRepository):
     """MongoDB implementation for SubtitlePair repository."""
@@ -152,8 +156,42 @@ class MongoDBSubtitlePairRepository(ISubtitlePairRepository):
         if not pairs:
             return 0
         documents = [self._entity_to_doc(p) for p in pairs]
-        result = await self.collection.insert_many(documents)
-        return len(result.inserted_ids)
+        failed = await self._insert_documents(documents)
+
+        # insert_many fills in _id on each document, so ids are known without a read-back
+        inserted = 0
+        for i, (pair, doc) in enumerate(zip(pairs, documents)):
+            if i not in failed:
+                pair.id = str(doc["_id"])
+                inserted += 1
+        return inserted
+
+    async def create_many_raw(self, documents: List[dict]) -> int:
+        """Insert ready-made pair documents, skipping entity conversion. Returns count inserted.
+
+        The documents must already use the collection's field names; insert_many
+        adds an _id to each of them.
+        """
+        if not documents:
+            return 0
+        failed = await self._insert_documents(documents)
+        return len(documents) - len(failed)
+
+    async def _insert_documents(self, documents: List[dict]) -> set:
+        """Insert documents unordered; return indexes rejected as duplicates."""
+        # Unordered insert: the server may apply the batch in parallel and a
+        # duplicate seq_id does not abort the remaining documents
+        try:
+            await self.collection.insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            details = e.details or {}
+            write_errors = details.get("writeErrors", [])
+            if details.get("writeConcernErrors") or any(
+                err.get("code") != DUPLICATE_KEY_ERROR for err in write_errors
+            ):
+                raise
+            return {err.get("index") for err in write_errors}
+        return set()
 
     async def update(self, pair: SubtitlePair) -> Optional[SubtitlePair]:
         try:
@@ -221,14 +259,17 @@ class MongoDBSubtitlePairRepository(ISubtitlePairRepository):
             if isinstance(ids, list) and len(ids) > 1:
                 to_delete_ids.extend(ids[1:])
 
-        deleted_count = 0
-        CHUNK = 1000
-        for i in range(0, len(to_delete_ids), CHUNK):
-            chunk = to_delete_ids[i:i+CHUNK]
-            result = await self.collection.delete_many({"_id": {"$in": chunk}})
-            deleted_count += result.deleted_count
+        if not to_delete_ids:
+            return 0
 
-        return deleted_count
+        # One bulk_write round trip; chunking only keeps each $in list small
+        CHUNK = 1000
+        requests = [
+            DeleteMany({"_id": {"$in": to_delete_ids[i:i+CHUNK]}})
+            for i in range(0, len(to_delete_ids), CHUNK)
+        ]
+        result = await self.collection.bulk_write(requests, ordered=False)
+        return result.deleted_count
 
     async def count_total(self) -> int:
         try:
@@ -240,8 +281,9 @@ class MongoDBSubtitlePairRepository(ISubtitlePairRepository):
         return count
 
     async def get_distinct_files_en(self) -> List[str]:
+        # distinct() runs server-side and can use the file_en index (DISTINCT_SCAN)
         files = await self.collection.distinct("file_en")
-        files = [str(f).replace('_en.srt', '') for f in files if f]
+        files = [str(f).removesuffix('_en.srt') for f in files if f]
         files.sort(key=lambda s: s.lower())
         return files
 
@@ -329,6 +371,21 @@ class MongoDBIdiomRepository(IIdiomRepository):
         await self.collection.update_one(filter_dict, {"$set": doc}, upsert=True)
         return idiom
 
+    async def upsert_many(self, idioms: List[Idiom]) -> int:
+        """Upsert many idioms by pair_seq_id in a single bulk_write. Returns count written."""
+        if not idioms:
+            return 0
+        requests = [
+            UpdateOne(
+                {"pair_seq_id": item.pair_seq_id} if item.pair_seq_id is not None else {"_id": ObjectId()},
+                {"$set": self._entity_to_doc(item)},
+                upsert=True,
+            )
+            for item in idioms
+        ]
+        result = await self.collection.bulk_write(requests, ordered=False)
+        return result.upserted_count + result.modified_count
+
     @staticmethod
     def _entity_to_doc(idiom: Idiom) -> dict:
         return {
@@ -373,6 +430,21 @@ class MongoDBQuoteRepository(IQuoteRepository):
         await self.collection.update_one(filter_dict, {"$set": doc}, upsert=True)
         return quote
 
+    async def upsert_many(self, quotes: List[Quote]) -> int:
+        """Upsert many quotes by pair_seq_id in a single bulk_write. Returns count written."""
+        if not quotes:
+            return 0
+        requests = [
+            UpdateOne(
+                {"pair_seq_id": item.pair_seq_id} if item.pair_seq_id is not None else {"_id": ObjectId()},
+                {"$set": self._entity_to_doc(item)},
+                upsert=True,
+            )
+            for item in quotes
+        ]
+        result = await self.collection.bulk_write(requests, ordered=False)
+        return result.upserted_count + result.modified_count
+
     @staticmethod
     def _entity_to_doc(quote: Quote) -> dict:
         return {
@@ -1,12 +1,20 @@
 """Test configuration and fixtures."""
 import os
 import asyncio
+import dataclasses
+import uuid
+from datetime import datetime
 from typing import AsyncGenerator
 import pytest
 import pytest_asyncio
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from mongomock_motor import AsyncMongoMockClient
+from pymongo.errors import PyMongoError
+from sqlalchemy import text
+from sqlalchemy.exc import InterfaceError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
+from freezegun import freeze_time
 
 # Add src to path for imports
 import sys
@@ -25,7 +33,9 @@ from src.infrastructure.database.subtitle_mongo_repo import (
 from src.infrastructure.security.password import SHA256PasswordHandler
 from src.infrastructure.security.jwt_handler import ManualJWTHandler
 from src.application.auth_service import AuthService
-from src.application.subtitle_service import SubtitlePairService
+from src.application.dto import TokenResponseDTO
+from src.domain.entities import User
+from src.application.subtitle_service import SubtitlePairService, invalidate_stats_cache
 
 
 # Test database URLs
@@ -37,44 +47,110 @@ TEST_MONGODB_URL = os.getenv(
     "TEST_MONGODB_URL",
     "mongodb://localhost:27017"
 )
-TEST_MONGODB_DB = "subreverse_test"
+# Under pytest-xdist every worker ("gw0", "gw1", ...) gets its own Mongo
+# database and Postgres schema so workers never see each other's rows
+XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER", "")
+TEST_MONGODB_DB = f"subreverse_test_{XDIST_WORKER}" if XDIST_WORKER else "subreverse_test"
+TEST_POSTGRES_SCHEMA = f"test_{XDIST_WORKER}" if XDIST_WORKER else None
 JWT_SECRET = "test_secret_key_for_testing_only"
+# How long session fixtures wait for a database before skipping its tests
+SERVICE_CONNECT_TIMEOUT_S = 2
+# Fixed instant for clock-dependent tests (midday, so "today" never flips mid-test)
+FROZEN_NOW = datetime(2024, 1, 15, 12, 0, 0)
 
 
 @pytest.fixture(scope="session")
-def event_loop():
+def event_loop_policy():
+    """Use uvloop's event loop policy when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def event_loop(event_loop_policy):
     """Create event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
+    loop = event_loop_policy.new_event_loop()
     yield loop
     loop.close()
 
 
+@pytest.fixture
+def frozen_now():
+    """Freeze the clock at FROZEN_NOW for the test and return that instant.
+
+    ``real_asyncio`` keeps the event loop on the real monotonic clock so
+    driver timeouts keep working.
+    """
+    with freeze_time(FROZEN_NOW, real_asyncio=True):
+        yield FROZEN_NOW
+
+
 # PostgreSQL fixtures
-@pytest_asyncio.fixture
+def _postgres_connect_args() -> dict:
+    """asyncpg connect arguments for the test engine."""
+    # The suite repeats the same few repository queries, so keep their
+    # prepared statements cached on each pooled connection
+    connect_args = {
+        "prepared_statement_cache_size": 1024,
+        "timeout": SERVICE_CONNECT_TIMEOUT_S,
+    }
+    if TEST_POSTGRES_SCHEMA:
+        connect_args["server_settings"] = {"search_path": TEST_POSTGRES_SCHEMA}
+    return connect_args
+
+
+@pytest_asyncio.fixture(scope="session")
 async def postgres_engine():
-    """Create test PostgreSQL engine."""
+    """Create test PostgreSQL engine and schema once per test session."""
+    # The engine's connection pool lives for the whole session, so tests reuse
+    # warm asyncpg connections instead of paying connect+auth each time.
+    # Pre-ping is skipped: the test server is local and never recycles sockets.
     engine = create_async_engine(
         TEST_POSTGRES_URL,
         echo=False,
-        pool_pre_ping=True
+        pool_pre_ping=False,
+        pool_size=5,
+        max_overflow=15,
+        pool_recycle=300,
+        connect_args=_postgres_connect_args()
     )
 
+    # Probe the server first. A session fixture that skips caches the skip, so an
+    # unreachable server costs one short connect timeout, not one per test.
+    # Only connectivity errors skip; bad credentials or DDL fail below.
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except (OSError, asyncio.TimeoutError, InterfaceError, OperationalError) as e:
+        await engine.dispose()
+        pytest.skip(f"PostgreSQL unavailable at {TEST_POSTGRES_URL}: {e}")
+
     # Create all tables
     async with engine.begin() as conn:
+        if TEST_POSTGRES_SCHEMA:
+            await conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{TEST_POSTGRES_SCHEMA}"'))
         await conn.run_sync(Base.metadata.create_all)
 
     yield engine
 
-    # Drop all tables after tests
+    # Drop all tables after the session
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+        if TEST_POSTGRES_SCHEMA:
+            await conn.execute(text(f'DROP SCHEMA IF EXISTS "{TEST_POSTGRES_SCHEMA}" CASCADE'))
 
     await engine.dispose()
 
 
 @pytest_asyncio.fixture
 async def postgres_session(postgres_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create test PostgreSQL session."""
+    """Create test PostgreSQL session.
+
+    Tables are emptied after each test instead of being dropped and recreated.
+    """
     async_session_maker = async_sessionmaker(
         postgres_engine,
         class_=AsyncSession,
@@ -85,6 +161,10 @@ async def postgres_session(postgres_engine) -> AsyncGenerator[AsyncSession, None
         yield session
         await session.rollback()
 
+    tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+    async with postgres_engine.begin() as conn:
+        await conn.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+
 
 @pytest_asyncio.fixture
 async def postgres_user_repo(postgres_session):
@@ -92,11 +172,52 @@ async def postgres_user_repo(postgres_session):
     return PostgreSQLUserRepository(postgres_session)
 
 
+def pytest_addoption(parser):
+    """Register command line options."""
+    parser.addoption(
+        "--real-mongo",
+        action="store_true",
+        default=False,
+        help="Run MongoDB tests against TEST_MONGODB_URL instead of in-process mongomock-motor",
+    )
+
+
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line(
+        "markers",
+        "real_mongo: test needs MongoDB server features ($sample); "
+        "skipped unless --real-mongo is given",
+    )
+
+
 # MongoDB fixtures
-@pytest_asyncio.fixture
-async def mongodb_client():
-    """Create test MongoDB client."""
-    client = AsyncIOMotorClient(TEST_MONGODB_URL)
+MONGO_COLLECTIONS = ("pairs", "idioms", "quotes", "system_stats")
+
+
+async def _create_mongo_indexes(db: AsyncIOMotorDatabase) -> None:
+    """Create the indexes the repositories rely on."""
+    await db.pairs.create_index("seq_id", unique=True, sparse=True)
+    await db.pairs.create_index([("en", 1)])
+    await db.pairs.create_index([("ru", 1)])
+    await db.pairs.create_index([("file_en", 1)])
+    await db.pairs.create_index([("category", 1)])
+
+
+@pytest_asyncio.fixture(scope="session")
+async def real_mongodb_client():
+    """Create the real MongoDB client and its indexes once per test session."""
+    client = AsyncIOMotorClient(
+        TEST_MONGODB_URL,
+        serverSelectionTimeoutMS=SERVICE_CONNECT_TIMEOUT_S * 1000
+    )
+    try:
+        await client.admin.command("ping")
+    except PyMongoError as e:
+        client.close()
+        pytest.skip(f"MongoDB unavailable at {TEST_MONGODB_URL}: {e}")
+
+    await _create_mongo_indexes(client[TEST_MONGODB_DB])
     yield client
 
     # Clean up test database
@@ -104,25 +225,35 @@ async def mongodb_client():
     client.close()
 
 
+@pytest.fixture
+def mongodb_client(request):
+    """Create test MongoDB client.
+
+    Defaults to an in-process mongomock-motor store; ``--real-mongo`` switches
+    to the session-wide client for TEST_MONGODB_URL.
+    """
+    if request.config.getoption("--real-mongo"):
+        return request.getfixturevalue("real_mongodb_client")
+    if request.node.get_closest_marker("real_mongo"):
+        pytest.skip("needs a real MongoDB server (run with --real-mongo)")
+    return AsyncMongoMockClient()
+
+
 @pytest_asyncio.fixture
 async def mongodb_db(mongodb_client) -> AsyncIOMotorDatabase:
     """Create test MongoDB database."""
     db = mongodb_client[TEST_MONGODB_DB]
 
-    # Create indexes
-    await db.pairs.create_index("seq_id", unique=True, sparse=True)
-    await db.pairs.create_index([("en", 1)])
-    await db.pairs.create_index([("ru", 1)])
-    await db.pairs.create_index([("file_en", 1)])
-    await db.pairs.create_index([("category", 1)])
+    # A fresh mock store has no indexes; the real one was indexed at session start
+    if isinstance(mongodb_client, AsyncMongoMockClient):
+        await _create_mongo_indexes(db)
 
     yield db
 
-    # Clean all collections after each test
-    await db.pairs.delete_many({})
-    await db.idioms.delete_many({})
-    await db.quotes.delete_many({})
-    await db.system_stats.delete_many({})
+    # Clean all collections after each test. Tests write stats through the
+    # repository directly, so the service-level stats cache is dropped too.
+    await asyncio.gather(*(db[name].delete_many({}) for name in MONGO_COLLECTIONS))
+    invalidate_stats_cache()
 
 
 @pytest_asyncio.fixture
@@ -197,24 +328,54 @@ async def subtitle_service(
 @pytest_asyncio.fixture
 async def async_client() -> AsyncGenerator[AsyncClient, None]:
     """Create async HTTP client for testing API endpoints."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         yield client
 
 
 # Helper fixtures
-@pytest_asyncio.fixture
-async def test_user(auth_service):
-    """Create a test user."""
-    from src.application.dto import SignupDTO
+TEST_USER_PASSWORD = "testpassword123"
 
-    signup_data = SignupDTO(
+
+@pytest.fixture(scope="session")
+def test_user_template():
+    """Hash the test user's password and sign its token once per session.
+
+    Returns a (User, token) tuple. The row itself is truncated after every
+    test, so ``test_user`` re-inserts it with the same id and the token stays valid.
+    """
+    password_handler = SHA256PasswordHandler()
+    password_hash, salt = password_handler.hash_password(TEST_USER_PASSWORD)
+
+    now = datetime.utcnow()
+    user = User(
+        id=str(uuid.uuid4()),
         username="testuser",
         email="test@example.com",
-        password="testpassword123"
+        password_hash=password_hash,
+        salt=salt,
+        created_at=now,
+        energy=10,
+        max_energy=10,
+        level=1,
+        xp=0,
+        role="user",
+        last_recharge=now
+    )
+    token_service = AuthService(
+        user_repository=None,
+        password_handler=password_handler,
+        jwt_handler=ManualJWTHandler(JWT_SECRET, "HS256"),
+        jwt_expire_seconds=3600
     )
+    return user, token_service._generate_token(user)
+
 
-    result = await auth_service.signup(signup_data)
-    return result
+@pytest_asyncio.fixture
+async def test_user(postgres_user_repo, test_user_template) -> TokenResponseDTO:
+    """Create a test user (password hash and token come from the session cache)."""
+    user, token = test_user_template
+    created = await postgres_user_repo.create(dataclasses.replace(user))
+    return TokenResponseDTO(token=token, user=AuthService._to_user_dto(created))
 
 
 @pytest_asyncio.fixture
@@ -223,8 +384,19 @@ async def test_user_token(test_user):
     return test_user.token
 
 
+@pytest_asyncio.fixture(scope="session")
+async def session_authenticated_client(test_user_template) -> AsyncGenerator[AsyncClient, None]:
+    """HTTP client carrying the test user's token, shared by the whole session."""
+    _, token = test_user_template
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+        headers={"Authorization": f"Bearer {token}"}
+    ) as client:
+        yield client
+
+
 @pytest_asyncio.fixture
-async def authenticated_client(async_client, test_user_token) -> AsyncClient:
+async def authenticated_client(session_authenticated_client, test_user) -> AsyncClient:
     """Create authenticated HTTP client."""
-    async_client.headers.update({"Authorization": f"Bearer {test_user_token}"})
-    return async_client
+    return session_authenticated_client
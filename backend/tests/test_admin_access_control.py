@@ -1,7 +1,7 @@
 """Tests for admin access control on protected endpoints."""
 import pytest
 import pytest_asyncio
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
 from src.application.dto import SignupDTO
 
 
@@ -60,7 +60,7 @@ async def regular_client(async_client, regular_user_token) -> AsyncClient:
     """Create authenticated HTTP client with regular user."""
     # Create a new client instance to avoid header conflicts
     from src.api.main import app
-    async with AsyncClient(app=app, base_url="http://test") as client:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         client.headers.update({"Authorization": f"Bearer {regular_user_token}"})
         yield client
 
@@ -1,83 +1,92 @@
 """Tests for MongoDB Idiom and Quote Repositories."""
+import dataclasses
+
 import pytest
 from src.domain.entities import Idiom, Quote, SystemStats
 
 
 @pytest.mark.asyncio
-class TestMongoDBIdiomRepository:
-    """Test MongoDB idiom repository operations."""
-
-    async def test_upsert_new_idiom(self, mongo_idiom_repo):
-        """Test creating a new idiom."""
-        idiom = Idiom(
+@pytest.mark.parametrize(
+    "repo_fixture,entity_cls,base_seq_id",
+    [
+        ("mongo_idiom_repo", Idiom, 1000),
+        ("mongo_quote_repo", Quote, 4000),
+    ],
+    ids=["idiom", "quote"],
+)
+class TestMongoDBItemRepository:
+    """Test MongoDB idiom and quote repository operations.
+
+    Both collections share the same upsert/get_recent contract, so every
+    test runs once per repository.
+    """
+
+    async def test_upsert_new_item(self, request, repo_fixture, entity_cls, base_seq_id):
+        """Test creating a new item."""
+        repo = request.getfixturevalue(repo_fixture)
+        item = entity_cls(
             id=None,
             en="Break a leg!",
             ru="Ни пуха, ни пера!",
-            pair_seq_id=1001,
+            pair_seq_id=base_seq_id + 1,
             rating=5,
             filename="movie_en.srt",
             time="00:01:23,456 --> 00:01:26,789",
             owner_username="testuser"
         )
 
-        created = await mongo_idiom_repo.upsert(idiom)
+        created = await repo.upsert(item)
 
         assert created is not None
         assert created.en == "Break a leg!"
         assert created.ru == "Ни пуха, ни пера!"
-        assert created.pair_seq_id == 1001
-
-    async def test_upsert_update_existing(self, mongo_idiom_repo):
-        """Test updating existing idiom by pair_seq_id."""
-        # Create initial idiom
-        idiom = Idiom(
+        assert created.pair_seq_id == base_seq_id + 1
+
+    async def test_upsert_update_existing(self, request, repo_fixture, entity_cls, base_seq_id):
+        """Test updating existing item by pair_seq_id."""
+        repo = request.getfixturevalue(repo_fixture)
+        seq_id = base_seq_id + 2
+        # Create initial item
+        item = entity_cls(
             id=None,
             en="Piece of cake",
             ru="Проще простого",
-            pair_seq_id=1002,
+            pair_seq_id=seq_id,
             rating=3,
             filename="movie_en.srt",
             time="00:02:00,000 --> 00:02:03,000",
             owner_username="user1"
         )
-        await mongo_idiom_repo.upsert(idiom)
+        await repo.upsert(item)
 
-        # Update with same pair_seq_id
-        updated_idiom = Idiom(
-            id=None,
-            en="Piece of cake",
-            ru="Проще простого",
-            pair_seq_id=1002,
-            rating=7,  # Updated rating
-            filename="movie_en.srt",
-            time="00:02:00,000 --> 00:02:03,000",
-            owner_username="user1"
-        )
-        await mongo_idiom_repo.upsert(updated_idiom)
+        # Update with same pair_seq_id, only the rating changes
+        updated_item = dataclasses.replace(item, rating=7)
+        await repo.upsert(updated_item)
 
-        # Get recent idioms and verify
-        recent = await mongo_idiom_repo.get_recent(10)
+        # Get recent items and verify
+        recent = await repo.get_recent(10)
         assert len(recent) >= 1
 
-        # Find the idiom with our pair_seq_id
+        # Find the item with our pair_seq_id
         found = None
         for r in recent:
-            if r.pair_seq_id == 1002:
+            if r.pair_seq_id == seq_id:
                 found = r
                 break
 
         assert found is not None
         assert found.rating == 7  # Should have updated rating
 
-    async def test_get_recent_idioms(self, mongo_idiom_repo):
-        """Test getting recent idioms."""
-        # Create multiple idioms
-        idioms = [
-            Idiom(
+    async def test_get_recent(self, request, repo_fixture, entity_cls, base_seq_id):
+        """Test getting recent items."""
+        repo = request.getfixturevalue(repo_fixture)
+        # Create multiple items
+        items = [
+            entity_cls(
                 id=None,
-                en=f"Idiom {i}",
-                ru=f"Идиома {i}",
-                pair_seq_id=2000 + i,
+                en=f"Item {i}",
+                ru=f"Элемент {i}",
+                pair_seq_id=base_seq_id + 1000 + i,
                 rating=i,
                 filename="movie_en.srt",
                 time=f"00:0{i}:00,000 --> 00:0{i}:03,000",
@@ -86,151 +95,36 @@ class TestMongoDBIdiomRepository:
             for i in range(5)
         ]
 
-        for idiom in idioms:
-            await mongo_idiom_repo.upsert(idiom)
+        for item in items:
+            await repo.upsert(item)
 
         # Get recent (should be sorted by insertion time, newest first)
-        recent = await mongo_idiom_repo.get_recent(3)
+        recent = await repo.get_recent(3)
 
         assert len(recent) <= 3
-        # Most recent should be "Idiom 4" (last inserted)
+        # Most recent should be "Item 4" (last inserted)
         if len(recent) > 0:
-            assert "Idiom" in recent[0].en
+            assert "Item" in recent[0].en
 
-    async def test_get_recent_with_limit(self, mongo_idiom_repo):
+    async def test_get_recent_with_limit(self, request, repo_fixture, entity_cls, base_seq_id):
         """Test that limit parameter works."""
-        # Create 10 idioms
-        for i in range(10):
-            idiom = Idiom(
-                id=None,
-                en=f"Test idiom {i}",
-                ru=f"Тестовая идиома {i}",
-                pair_seq_id=3000 + i,
-                rating=0,
-                filename="test.srt",
-                time="00:00:01,000 --> 00:00:03,000",
-                owner_username="user"
-            )
-            await mongo_idiom_repo.upsert(idiom)
-
-        # Get only 5 most recent
-        recent = await mongo_idiom_repo.get_recent(5)
-
-        assert len(recent) <= 5
-
-
-@pytest.mark.asyncio
-class TestMongoDBQuoteRepository:
-    """Test MongoDB quote repository operations."""
-
-    async def test_upsert_new_quote(self, mongo_quote_repo):
-        """Test creating a new quote."""
-        quote = Quote(
-            id=None,
-            en="To be or not to be",
-            ru="Быть или не быть",
-            pair_seq_id=4001,
-            rating=10,
-            filename="shakespeare_en.srt",
-            time="00:05:00,000 --> 00:05:05,000",
-            owner_username="shakespeare_fan"
-        )
-
-        created = await mongo_quote_repo.upsert(quote)
-
-        assert created is not None
-        assert created.en == "To be or not to be"
-        assert created.ru == "Быть или не быть"
-        assert created.pair_seq_id == 4001
-
-    async def test_upsert_update_existing_quote(self, mongo_quote_repo):
-        """Test updating existing quote by pair_seq_id."""
-        # Create initial quote
-        quote = Quote(
-            id=None,
-            en="May the Force be with you",
-            ru="Да пребудет с тобой Сила",
-            pair_seq_id=4002,
-            rating=8,
-            filename="starwars_en.srt",
-            time="00:10:00,000 --> 00:10:03,000",
-            owner_username="fan1"
-        )
-        await mongo_quote_repo.upsert(quote)
-
-        # Update with same pair_seq_id
-        updated_quote = Quote(
-            id=None,
-            en="May the Force be with you",
-            ru="Да пребудет с тобой Сила",
-            pair_seq_id=4002,
-            rating=10,  # Updated rating
-            filename="starwars_en.srt",
-            time="00:10:00,000 --> 00:10:03,000",
-            owner_username="fan1"
-        )
-        await mongo_quote_repo.upsert(updated_quote)
-
-        # Get recent quotes and verify
-        recent = await mongo_quote_repo.get_recent(10)
-        assert len(recent) >= 1
-
-        # Find the quote with our pair_seq_id
-        found = None
-        for r in recent:
-            if r.pair_seq_id == 4002:
-                found = r
-                break
-
-        assert found is not None
-        assert found.rating == 10  # Should have updated rating
-
-    async def test_get_recent_quotes(self, mongo_quote_repo):
-        """Test getting recent quotes."""
-        # Create multiple quotes
-        quotes = [
-            Quote(
-                id=None,
-                en=f"Famous quote {i}",
-                ru=f"Знаменитая цитата {i}",
-                pair_seq_id=5000 + i,
-                rating=i * 2,
-                filename="quotes_en.srt",
-                time=f"00:0{i}:00,000 --> 00:0{i}:05,000",
-                owner_username="quotelover"
-            )
-            for i in range(5)
-        ]
-
-        for quote in quotes:
-            await mongo_quote_repo.upsert(quote)
-
-        # Get recent (should be sorted by insertion time, newest first)
-        recent = await mongo_quote_repo.get_recent(3)
-
-        assert len(recent) <= 3
-        # Most recent should contain "Famous quote"
-        if len(recent) > 0:
-            assert "Famous quote" in recent[0].en
-
-    async def test_get_recent_quotes_with_limit(self, mongo_quote_repo):
-        """Test that limit parameter works for quotes."""
-        # Create 10 quotes
+        repo = request.getfixturevalue(repo_fixture)
+        # Create 10 items
         for i in range(10):
-            quote = Quote(
+            item = entity_cls(
                 id=None,
-                en=f"Test quote {i}",
-                ru=f"Тестовая цитата {i}",
-                pair_seq_id=6000 + i,
+                en=f"Test item {i}",
+                ru=f"Тестовый элемент {i}",
+                pair_seq_id=base_seq_id + 2000 + i,
                 rating=0,
                 filename="test.srt",
                 time="00:00:01,000 --> 00:00:03,000",
                 owner_username="user"
             )
-            await mongo_quote_repo.upsert(quote)
+            await repo.upsert(item)
 
         # Get only 5 most recent
-        recent = await mongo_quote_repo.get_recent(5)
+        recent = await repo.get_recent(5)
 
         assert len(recent) <= 5
 
@@ -1,7 +1,12 @@
 """Tests for MongoDB Subtitle Pair Repository."""
+import asyncio
+
 import pytest
 from src.domain.entities import SubtitlePair
 
+# SRT timing strings shared by the bulk-insert tests, formatted once per module
+TIME_SLOTS = [f"00:00:{i:02d},000 --> 00:00:{i+2:02d},000" for i in range(60)]
+
 
 @pytest.mark.asyncio
 class TestMongoDBSubtitlePairRepository:
@@ -88,8 +93,8 @@ class TestMongoDBSubtitlePairRepository:
                 ru=f"Субтитр {i}",
                 file_en="test_en.srt",
                 file_ru="test_ru.srt",
-                time_en=f"00:00:{i:02d},000 --> 00:00:{i+2:02d},000",
-                time_ru=f"00:00:{i:02d},000 --> 00:00:{i+2:02d},000",
+                time_en=TIME_SLOTS[i],
+                time_ru=TIME_SLOTS[i],
                 rating=0,
                 category=None,
                 seq_id=1000 + i
@@ -100,6 +105,8 @@ class TestMongoDBSubtitlePairRepository:
         count = await mongo_subtitle_repo.create_many(pairs)
 
         assert count == 5
+        # Ids are filled in from the batch insert
+        assert all(p.id is not None for p in pairs)
 
         # Verify they were created
         total = await mongo_subtitle_repo.count_total()
@@ -223,16 +230,26 @@ class TestMongoDBSubtitlePairRepository:
         ]
         await mongo_subtitle_repo.create_many(pairs)
 
-        # Search for 'fox'
-        results = await mongo_subtitle_repo.search("fox")
+        # Search for 'fox' and 'собака' (Russian) concurrently
+        en_results, ru_results = await asyncio.gather(
+            mongo_subtitle_repo.search("fox"),
+            mongo_subtitle_repo.search("собака")
+        )
 
-        assert len(results) >= 1
-        assert any("fox" in r.en.lower() for r in results)
+        assert len(en_results) >= 1
+        assert any("fox" in r.en.lower() for r in en_results)
 
-        # Search for 'собака' (Russian)
-        results = await mongo_subtitle_repo.search("собака")
-        assert len(results) >= 1
-        assert any("собака" in r.ru.lower() for r in results)
+        assert len(ru_results) >= 1
+        assert any("собака" in r.ru.lower() for r in ru_results)
+
+        # Partial words match too: search is a substring regex, not a token lookup
+        en_partial, ru_partial = await asyncio.gather(
+            mongo_subtitle_repo.search("fo"),
+            mongo_subtitle_repo.search("собак")
+        )
+
+        assert any(r.en == "The quick brown fox" for r in en_partial)
+        assert any(r.ru == "Ленивая собака" for r in ru_partial)
 
     async def test_search_exact_phrase(self, mongo_subtitle_repo):
         """Test searching with exact phrase (quoted)."""
@@ -257,6 +274,7 @@ class TestMongoDBSubtitlePairRepository:
         assert len(results) >= 1
         assert any("have a dream" in r.en.lower() for r in results)
 
+    @pytest.mark.real_mongo
     async def test_get_random(self, mongo_subtitle_repo):
         """Test getting a random pair."""
         # Create multiple pairs
@@ -267,8 +285,8 @@ class TestMongoDBSubtitlePairRepository:
                 ru=f"Случайный субтитр {i}",
                 file_en="test_en.srt",
                 file_ru="test_ru.srt",
-                time_en=f"00:00:{i:02d},000 --> 00:00:{i+2:02d},000",
-                time_ru=f"00:00:{i:02d},000 --> 00:00:{i+2:02d},000",
+                time_en=TIME_SLOTS[i],
+                time_ru=TIME_SLOTS[i],
                 rating=0,
                 category=None,
                 seq_id=700 + i
@@ -297,8 +315,8 @@ class TestMongoDBSubtitlePairRepository:
                 ru=f"Тест подсчёта {i}",
                 file_en="test_en.srt",
                 file_ru="test_ru.srt",
-                time_en=f"00:00:{i:02d},000 --> 00:00:{i+2:02d},000",
-                time_ru=f"00:00:{i:02d},000 --> 00:00:{i+2:02d},000",
+                time_en=TIME_SLOTS[i],
+                time_ru=TIME_SLOTS[i],
                 rating=0,
                 category=None,
                 seq_id=800 + i
@@ -348,8 +366,8 @@ class TestMongoDBSubtitlePairRepository:
         """Test getting distinct file list."""
         # Create pairs from different files
         files = ["movie1_en.srt", "movie2_en.srt", "movie3_en.srt"]
-        for i, file in enumerate(files):
-            pair = SubtitlePair(
+        pairs = [
+            SubtitlePair(
                 id=None,
                 en=f"Subtitle from {file}",
                 ru=f"Субтитр из {file}",
@@ -361,7 +379,9 @@ class TestMongoDBSubtitlePairRepository:
                 category=None,
                 seq_id=1000 + i
             )
-            await mongo_subtitle_repo.create(pair)
+            for i, file in enumerate(files)
+        ]
+        await mongo_subtitle_repo.create_many(pairs)
 
         # Get distinct files
         distinct_files = await mongo_subtitle_repo.get_distinct_files_en()
@@ -414,20 +434,18 @@ class TestMongoDBSubtitlePairRepository:
             )
             for i in range(5)
         ]
-        created_pairs = []
-        for p in pairs:
-            created = await mongo_subtitle_repo.create(p)
-            created_pairs.append(created)
+        await mongo_subtitle_repo.create_many(pairs)
 
-        # Get middle pair
-        middle_pair = created_pairs[2]
+        # Get middle pair (create_many filled in its id)
+        middle_pair = pairs[2]
 
-        # Get next pair (offset +1)
-        next_pair = await mongo_subtitle_repo.get_neighbor(middle_pair.id, 1)
+        # Get next (offset +1) and previous (offset -1) pairs concurrently
+        next_pair, prev_pair = await asyncio.gather(
+            mongo_subtitle_repo.get_neighbor(middle_pair.id, 1),
+            mongo_subtitle_repo.get_neighbor(middle_pair.id, -1)
+        )
         assert next_pair is not None
         assert next_pair.seq_id == 1203
 
-        # Get previous pair (offset -1)
-        prev_pair = await mongo_subtitle_repo.get_neighbor(middle_pair.id, -1)
         assert prev_pair is not None
         assert prev_pair.seq_id == 1201
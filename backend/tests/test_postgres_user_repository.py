@@ -1,28 +1,42 @@
 """Tests for PostgreSQL User Repository."""
 import pytest
-from datetime import datetime, timedelta
+from datetime import timedelta
 from src.domain.entities import User
 
 
+# Fields shared by every user built in this module
+_TEMPLATE_USER_KW = dict(
+    password_hash="hashed_password",
+    salt="random_salt",
+    energy=10,
+    max_energy=10,
+    level=1,
+    xp=0,
+    role="user",
+)
+
+
+@pytest.fixture
+def make_user(frozen_now):
+    """Build a User from the template; timestamps default to the frozen clock."""
+    def _make_user(**overrides) -> User:
+        fields = {**_TEMPLATE_USER_KW, "created_at": frozen_now, "last_recharge": frozen_now}
+        fields.update(overrides)
+        return User(**fields)
+
+    return _make_user
+
+
 @pytest.mark.asyncio
 class TestPostgreSQLUserRepository:
     """Test PostgreSQL user repository operations."""
 
-    async def test_create_user(self, postgres_user_repo):
+    async def test_create_user(self, postgres_user_repo, make_user):
         """Test creating a new user."""
-        user = User(
+        user = make_user(
             id="test-user-1",
             username="john_doe",
-            email="john@example.com",
-            password_hash="hashed_password",
-            salt="random_salt",
-            created_at=datetime.utcnow(),
-            energy=10,
-            max_energy=10,
-            level=1,
-            xp=0,
-            role="user",
-            last_recharge=datetime.utcnow()
+            email="john@example.com"
         )
 
         created = await postgres_user_repo.create(user)
@@ -34,110 +48,61 @@ class TestPostgreSQLUserRepository:
         assert created.energy == 10
         assert created.level == 1
 
-    async def test_get_user_by_id(self, postgres_user_repo):
-        """Test retrieving user by ID."""
+    @pytest.mark.parametrize("field, lookup", [
+        ("id", "get_by_id"),
+        ("email", "get_by_email"),
+        ("username", "get_by_username"),
+    ])
+    async def test_get_user_by(self, postgres_user_repo, make_user, field, lookup):
+        """Test retrieving user by ID, email and username."""
         # Create user
-        user = User(
+        user = make_user(
             id="test-user-2",
             username="jane_doe",
-            email="jane@example.com",
-            password_hash="hashed_password",
-            salt="random_salt",
-            created_at=datetime.utcnow(),
-            energy=10,
-            max_energy=10,
-            level=1,
-            xp=0,
-            role="user",
-            last_recharge=datetime.utcnow()
+            email="jane@example.com"
         )
         await postgres_user_repo.create(user)
 
-        # Retrieve user
-        retrieved = await postgres_user_repo.get_by_id("test-user-2")
+        # Retrieve user by the parametrized field
+        retrieved = await getattr(postgres_user_repo, lookup)(getattr(user, field))
 
         assert retrieved is not None
         assert retrieved.id == "test-user-2"
         assert retrieved.username == "jane_doe"
         assert retrieved.email == "jane@example.com"
 
-    async def test_get_user_by_email(self, postgres_user_repo):
-        """Test retrieving user by email."""
-        user = User(
-            id="test-user-3",
-            username="bob_smith",
-            email="bob@example.com",
-            password_hash="hashed_password",
-            salt="random_salt",
-            created_at=datetime.utcnow(),
-            energy=10,
-            max_energy=10,
-            level=1,
-            xp=0,
-            role="user",
-            last_recharge=datetime.utcnow()
+    async def test_get_nonexistent_user(self, postgres_user_repo):
+        """Test that a non-existent user is not found by id, email or username."""
+        found = await postgres_user_repo.exists_any(
+            user_id="nonexistent-id",
+            email="nonexistent@example.com",
+            username="nonexistent_user"
         )
-        await postgres_user_repo.create(user)
-
-        # Retrieve by email
-        retrieved = await postgres_user_repo.get_by_email("bob@example.com")
-
-        assert retrieved is not None
-        assert retrieved.email == "bob@example.com"
-        assert retrieved.username == "bob_smith"
-
-    async def test_get_user_by_username(self, postgres_user_repo):
-        """Test retrieving user by username."""
-        user = User(
-            id="test-user-4",
-            username="alice_wonder",
-            email="alice@example.com",
-            password_hash="hashed_password",
-            salt="random_salt",
-            created_at=datetime.utcnow(),
-            energy=10,
-            max_energy=10,
-            level=1,
-            xp=0,
-            role="user",
-            last_recharge=datetime.utcnow()
+        assert found == (False, False, False)
+
+    async def test_exists_any(self, postgres_user_repo, make_user):
+        """Test that exists_any reports each criterion separately."""
+        user = make_user(
+            id="test-user-11",
+            username="kate",
+            email="kate@example.com"
         )
         await postgres_user_repo.create(user)
 
-        # Retrieve by username
-        retrieved = await postgres_user_repo.get_by_username("alice_wonder")
-
-        assert retrieved is not None
-        assert retrieved.username == "alice_wonder"
-        assert retrieved.email == "alice@example.com"
-
-    async def test_get_nonexistent_user(self, postgres_user_repo):
-        """Test retrieving non-existent user returns None."""
-        retrieved = await postgres_user_repo.get_by_id("nonexistent-id")
-        assert retrieved is None
-
-        retrieved = await postgres_user_repo.get_by_email("nonexistent@example.com")
-        assert retrieved is None
-
-        retrieved = await postgres_user_repo.get_by_username("nonexistent_user")
-        assert retrieved is None
+        found = await postgres_user_repo.exists_any(
+            user_id="nonexistent-id",
+            email="kate@example.com",
+            username="kate"
+        )
+        assert found == (False, True, True)
 
-    async def test_update_user(self, postgres_user_repo):
+    async def test_update_user(self, postgres_user_repo, make_user):
         """Test updating user information."""
         # Create user
-        user = User(
+        user = make_user(
             id="test-user-5",
             username="charlie",
-            email="charlie@example.com",
-            password_hash="hashed_password",
-            salt="random_salt",
-            created_at=datetime.utcnow(),
-            energy=10,
-            max_energy=10,
-            level=1,
-            xp=0,
-            role="user",
-            last_recharge=datetime.utcnow()
+            email="charlie@example.com"
         )
         created = await postgres_user_repo.create(user)
 
@@ -152,22 +117,14 @@ class TestPostgreSQLUserRepository:
         assert updated.xp == 15
         assert updated.level == 2
 
-    async def test_update_energy_positive(self, postgres_user_repo):
+    async def test_update_energy_positive(self, postgres_user_repo, make_user):
         """Test atomically increasing user energy."""
         # Create user
-        user = User(
+        user = make_user(
             id="test-user-6",
             username="david",
             email="david@example.com",
-            password_hash="hashed_password",
-            salt="random_salt",
-            created_at=datetime.utcnow(),
-            energy=5,
-            max_energy=10,
-            level=1,
-            xp=0,
-            role="user",
-            last_recharge=datetime.utcnow()
+            energy=5
         )
         await postgres_user_repo.create(user)
 
@@ -179,22 +136,13 @@ class TestPostgreSQLUserRepository:
         updated = await postgres_user_repo.get_by_id("test-user-6")
         assert updated.energy == 8
 
-    async def test_update_energy_negative(self, postgres_user_repo):
+    async def test_update_energy_negative(self, postgres_user_repo, make_user):
         """Test atomically decreasing user energy."""
         # Create user
-        user = User(
+        user = make_user(
             id="test-user-7",
             username="eve",
-            email="eve@example.com",
-            password_hash="hashed_password",
-            salt="random_salt",
-            created_at=datetime.utcnow(),
-            energy=10,
-            max_energy=10,
-            level=1,
-            xp=0,
-            role="user",
-            last_recharge=datetime.utcnow()
+            email="eve@example.com"
         )
         await postgres_user_repo.create(user)
 
@@ -206,22 +154,14 @@ class TestPostgreSQLUserRepository:
         updated = await postgres_user_repo.get_by_id("test-user-7")
         assert updated.energy == 7
 
-    async def test_update_energy_insufficient(self, postgres_user_repo):
+    async def test_update_energy_insufficient(self, postgres_user_repo, make_user):
         """Test that energy cannot go negative."""
         # Create user with 2 energy
-        user = User(
+        user = make_user(
             id="test-user-8",
             username="frank",
             email="frank@example.com",
-            password_hash="hashed_password",
-            salt="random_salt",
-            created_at=datetime.utcnow(),
-            energy=2,
-            max_energy=10,
-            level=1,
-            xp=0,
-            role="user",
-            last_recharge=datetime.utcnow()
+            energy=2
         )
         await postgres_user_repo.create(user)
 
@@ -233,22 +173,15 @@ class TestPostgreSQLUserRepository:
         updated = await postgres_user_repo.get_by_id("test-user-8")
         assert updated.energy == 2
 
-    async def test_recharge_energy_new_day(self, postgres_user_repo):
+    async def test_recharge_energy_new_day(self, postgres_user_repo, make_user, frozen_now):
         """Test energy recharge on new day."""
         # Create user with last recharge yesterday
-        yesterday = datetime.utcnow() - timedelta(days=1)
-        user = User(
+        yesterday = frozen_now - timedelta(days=1)
+        user = make_user(
             id="test-user-9",
             username="grace",
             email="grace@example.com",
-            password_hash="hashed_password",
-            salt="random_salt",
-            created_at=datetime.utcnow(),
             energy=3,
-            max_energy=10,
-            level=1,
-            xp=0,
-            role="user",
             last_recharge=yesterday
         )
         await postgres_user_repo.create(user)
@@ -260,24 +193,16 @@ class TestPostgreSQLUserRepository:
         # Verify energy recharged
         updated = await postgres_user_repo.get_by_id("test-user-9")
         assert updated.energy == 10
-        assert updated.last_recharge.date() == datetime.utcnow().date()
+        assert updated.last_recharge.date() == frozen_now.date()
 
-    async def test_recharge_energy_same_day(self, postgres_user_repo):
+    async def test_recharge_energy_same_day(self, postgres_user_repo, make_user):
         """Test that energy doesn't recharge on same day."""
         # Create user with last recharge today
-        user = User(
+        user = make_user(
             id="test-user-10",
             username="henry",
             email="henry@example.com",
-            password_hash="hashed_password",
-            salt="random_salt",
-            created_at=datetime.utcnow(),
-            energy=5,
-            max_energy=10,
-            level=1,
-            xp=0,
-            role="user",
-            last_recharge=datetime.utcnow()
+            energy=5
         )
         await postgres_user_repo.create(user)
 
@@ -289,21 +214,12 @@ class TestPostgreSQLUserRepository:
         updated = await postgres_user_repo.get_by_id("test-user-10")
         assert updated.energy == 5
 
-    async def test_create_user_without_id(self, postgres_user_repo):
+    async def test_create_user_without_id(self, postgres_user_repo, make_user):
         """Test creating user without providing ID (auto-generated)."""
-        user = User(
+        user = make_user(
             id=None,  # No ID provided
             username="ivan",
-            email="ivan@example.com",
-            password_hash="hashed_password",
-            salt="random_salt",
-            created_at=datetime.utcnow(),
-            energy=10,
-            max_energy=10,
-            level=1,
-            xp=0,
-            role="user",
-            last_recharge=datetime.utcnow()
+            email="ivan@example.com"
         )
 
         created = await postgres_user_repo.create(user)
@@ -312,21 +228,12 @@ class TestPostgreSQLUserRepository:
         assert created.id is not None  # ID should be auto-generated
         assert created.username == "ivan"
 
-    async def test_update_nonexistent_user(self, postgres_user_repo):
+    async def test_update_nonexistent_user(self, postgres_user_repo, make_user):
         """Test updating non-existent user returns None."""
-        user = User(
+        user = make_user(
             id="nonexistent-user",
             username="ghost",
-            email="ghost@example.com",
-            password_hash="hashed_password",
-            salt="random_salt",
-            created_at=datetime.utcnow(),
-            energy=10,
-            max_energy=10,
-            level=1,
-            xp=0,
-            role="user",
-            last_recharge=datetime.utcnow()
+            email="ghost@example.com"
         )
 
         updated = await postgres_user_repo.update(user)
@@ -1,9 +1,75 @@
 """Tests for Subtitle API endpoints."""
+import asyncio
+import dataclasses
+
 import pytest
 from httpx import AsyncClient
 from src.domain.entities import SubtitlePair
 
 
+# Pair datasets built once per module. Inserting sets ids (create_many) or
+# adds _id (create_many_raw) on what it is given, so tests insert copies and
+# the templates stay pristine. Tests that never look at the inserted pairs
+# use raw documents and skip the entity round trip.
+_RANDOM_DOCS = tuple(
+    {
+        "en": f"Test subtitle {i}",
+        "ru": f"Тестовый субтитр {i}",
+        "file_en": "test_en.srt",
+        "file_ru": "test_ru.srt",
+        "time_en": f"00:00:{i:02d},000 --> 00:00:{i+2:02d},000",
+        "time_ru": f"00:00:{i:02d},000 --> 00:00:{i+2:02d},000",
+        "rating": 0,
+        "seq_id": 100 + i
+    }
+    for i in range(5)
+)
+
+_SEQUENCE_PAIRS = tuple(
+    SubtitlePair(
+        id=None,
+        en=f"Sequence {i}",
+        ru=f"Последовательность {i}",
+        file_en="sequence_en.srt",
+        file_ru="sequence_ru.srt",
+        time_en=f"00:00:{i*5:02d},000 --> 00:00:{i*5+3:02d},000",
+        time_ru=f"00:00:{i*5:02d},000 --> 00:00:{i*5+3:02d},000",
+        rating=0,
+        category=None,
+        seq_id=300 + i
+    )
+    for i in range(5)
+)
+
+_STATS_DOCS = tuple(
+    {
+        "en": f"Stats test {i}",
+        "ru": f"Тест статистики {i}",
+        "file_en": f"file{i}_en.srt",
+        "file_ru": f"file{i}_ru.srt",
+        "time_en": "00:00:01,000 --> 00:00:03,000",
+        "time_ru": "00:00:01,000 --> 00:00:03,000",
+        "rating": 0,
+        "seq_id": 1100 + i
+    }
+    for i in range(5)
+)
+
+_DELETE_DOCS = tuple(
+    {
+        "en": f"Delete me {i}",
+        "ru": f"Удали меня {i}",
+        "file_en": "test_en.srt",
+        "file_ru": "test_ru.srt",
+        "time_en": "00:00:01,000 --> 00:00:03,000",
+        "time_ru": "00:00:01,000 --> 00:00:03,000",
+        "rating": 0,
+        "seq_id": 1300 + i
+    }
+    for i in range(5)
+)
+
+
 @pytest.mark.asyncio
 class TestSubtitleEndpoints:
     """Test subtitle API endpoints."""
@@ -15,22 +81,7 @@ class TestSubtitleEndpoints:
     ):
         """Test getting a random subtitle pair."""
         # Create some test pairs
-        pairs = [
-            SubtitlePair(
-                id=None,
-                en=f"Test subtitle {i}",
-                ru=f"Тестовый субтитр {i}",
-                file_en="test_en.srt",
-                file_ru="test_ru.srt",
-                time_en=f"00:00:{i:02d},000 --> 00:00:{i+2:02d},000",
-                time_ru=f"00:00:{i:02d},000 --> 00:00:{i+2:02d},000",
-                rating=0,
-                category=None,
-                seq_id=100 + i
-            )
-            for i in range(5)
-        ]
-        await mongo_subtitle_repo.create_many(pairs)
+        await mongo_subtitle_repo.create_many_raw([dict(doc) for doc in _RANDOM_DOCS])
 
         # Get random pair
         response = await async_client.get("/api/get_random")
@@ -89,47 +140,22 @@ class TestSubtitleEndpoints:
     ):
         """Test temporal navigation with offset."""
         # Create sequence of pairs
-        pairs = [
-            SubtitlePair(
-                id=None,
-                en=f"Sequence {i}",
-                ru=f"Последовательность {i}",
-                file_en="sequence_en.srt",
-                file_ru="sequence_ru.srt",
-                time_en=f"00:00:{i*5:02d},000 --> 00:00:{i*5+3:02d},000",
-                time_ru=f"00:00:{i*5:02d},000 --> 00:00:{i*5+3:02d},000",
-                rating=0,
-                category=None,
-                seq_id=300 + i
-            )
-            for i in range(5)
-        ]
-        created_pairs = []
-        for p in pairs:
-            created = await mongo_subtitle_repo.create(p)
-            created_pairs.append(created)
+        pairs = [dataclasses.replace(p) for p in _SEQUENCE_PAIRS]
+        await mongo_subtitle_repo.create_many(pairs)
 
-        middle_pair = created_pairs[2]
+        middle_pair = pairs[2]
 
-        # Get with offset +1 (next)
-        response = await async_client.get(
-            f"/api/search/{middle_pair.id}/",
-            params={"offset": 1}
+        # Get with offset +1 (next) and -1 (previous) concurrently
+        next_response, prev_response = await asyncio.gather(
+            async_client.get(f"/api/search/{middle_pair.id}/", params={"offset": 1}),
+            async_client.get(f"/api/search/{middle_pair.id}/", params={"offset": -1})
         )
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["seq_id"] == 303
+        assert next_response.status_code == 200
+        assert next_response.json()["seq_id"] == 303
 
-        # Get with offset -1 (previous)
-        response = await async_client.get(
-            f"/api/search/{middle_pair.id}/",
-            params={"offset": -1}
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["seq_id"] == 301
+        assert prev_response.status_code == 200
+        assert prev_response.json()["seq_id"] == 301
 
     async def test_get_pair_not_found(self, async_client: AsyncClient):
         """Test getting non-existent pair."""
@@ -326,8 +352,7 @@ class TestSubtitleEndpoints:
             for i in range(3)
         ]
 
-        for idiom in idioms:
-            await mongo_idiom_repo.upsert(idiom)
+        await mongo_idiom_repo.upsert_many(idioms)
 
         # Get idioms
         response = await async_client.get("/api/idioms")
@@ -361,8 +386,7 @@ class TestSubtitleEndpoints:
             for i in range(3)
         ]
 
-        for quote in quotes:
-            await mongo_quote_repo.upsert(quote)
+        await mongo_quote_repo.upsert_many(quotes)
 
         # Get quotes
         response = await async_client.get("/api/quotes")
@@ -406,22 +430,7 @@ class TestSubtitleEndpoints:
     ):
         """Test computing statistics."""
         # Create some pairs
-        pairs = [
-            SubtitlePair(
-                id=None,
-                en=f"Stats test {i}",
-                ru=f"Тест статистики {i}",
-                file_en=f"file{i}_en.srt",
-                file_ru=f"file{i}_ru.srt",
-                time_en="00:00:01,000 --> 00:00:03,000",
-                time_ru="00:00:01,000 --> 00:00:03,000",
-                rating=0,
-                category=None,
-                seq_id=1100 + i
-            )
-            for i in range(5)
-        ]
-        await mongo_subtitle_repo.create_many(pairs)
+        await mongo_subtitle_repo.create_many_raw([dict(doc) for doc in _STATS_DOCS])
 
         # Compute stats
         response = await async_client.post("/api/stats")
@@ -442,22 +451,19 @@ class TestSubtitleEndpoints:
         duplicate_en = "Duplicate text"
         duplicate_ru = "Дублированный текст"
 
-        pairs = [
-            SubtitlePair(
-                id=None,
-                en=duplicate_en,
-                ru=duplicate_ru,
-                file_en=f"file{i}_en.srt",
-                file_ru=f"file{i}_ru.srt",
-                time_en="00:00:01,000 --> 00:00:03,000",
-                time_ru="00:00:01,000 --> 00:00:03,000",
-                rating=0,
-                category=None,
-                seq_id=1200 + i
-            )
+        await mongo_subtitle_repo.create_many_raw([
+            {
+                "en": duplicate_en,
+                "ru": duplicate_ru,
+                "file_en": f"file{i}_en.srt",
+                "file_ru": f"file{i}_ru.srt",
+                "time_en": "00:00:01,000 --> 00:00:03,000",
+                "time_ru": "00:00:01,000 --> 00:00:03,000",
+                "rating": 0,
+                "seq_id": 1200 + i
+            }
             for i in range(3)
-        ]
-        await mongo_subtitle_repo.create_many(pairs)
+        ])
 
         # Clear duplicates
         response = await async_client.post("/api/clear")
@@ -475,22 +481,7 @@ class TestSubtitleEndpoints:
     ):
         """Test deleting all pairs."""
         # Create some pairs
-        pairs = [
-            SubtitlePair(
-                id=None,
-                en=f"Delete me {i}",
-                ru=f"Удали меня {i}",
-                file_en="test_en.srt",
-                file_ru="test_ru.srt",
-                time_en="00:00:01,000 --> 00:00:03,000",
-                time_ru="00:00:01,000 --> 00:00:03,000",
-                rating=0,
-                category=None,
-                seq_id=1300 + i
-            )
-            for i in range(5)
-        ]
-        await mongo_subtitle_repo.create_many(pairs)
+        await mongo_subtitle_repo.create_many_raw([dict(doc) for doc in _DELETE_DOCS])
 
         # Delete all
         response = await async_client.post("/api/delete_all")
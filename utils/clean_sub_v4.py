@@ -16,36 +16,96 @@ then repairs them by:
    - If one interval in RU file contains multiple intervals in EN file, they are merged
    - This ensures both files have matching time intervals for proper alignment
 
-Usage: python clean_sub_v4.py
+Usage: python clean_sub_v4.py [--workers N]
+
+The module type-checks cleanly, so for large collections it can be run
+under PyPy (pypy3 clean_sub_v4.py) or compiled in place with mypyc
+(mypyc clean_sub_v4.py) and started through the compiled extension:
+python -c "import clean_sub_v4; clean_sub_v4.main()"
 """
 
+import argparse
+import codecs
+import io
 import os
 import re
+import sys
+from bisect import bisect_left
 from pathlib import Path
-import shutil
-from typing import List, Tuple
-from multiprocessing import Pool, cpu_count
+from itertools import chain
+from typing import Iterable, List, Optional, Tuple
+from multiprocessing import cpu_count, get_context
+
+# Precompiled patterns used on every subtitle entry
+_BRACKETED = re.compile(r'\([^)]*\)|\[[^\]]*\]|\{[^}]*\}')
+
+# Parsed subtitle entry: (index, start_time, end_time, text, cleaned_text, start_ms, end_ms)
+SubtitleEntry = Tuple[int, str, str, str, str, int, int]
+
+# Upper bound on files handed to a worker per task
+MAX_CHUNKSIZE = 64
+
+# Dashes (including the mis-decoded 'â€' bytes) and spaces trimmed from line edges
+_EDGE_CHARS = '-–—â€" '
 
 def find_srt_files(directory: str = ".") -> List[Path]:
-    """Find all .srt files in the directory and subdirectories."""
+    """
+    Find all .srt files in the directory and subdirectories.
+
+    Files reachable under several names (symlinks, hardlinks) are listed
+    once, under the first name found, so no file is repaired twice.
+    """
     srt_files = []
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            if file.lower().endswith('.srt'):
-                srt_files.append(Path(root) / file)
+    seen_files = set()
+    pending = [directory]
+
+    while pending:
+        current = pending.pop()
+        subdirs = []
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+
+                    if is_dir:
+                        # Like os.walk, don't descend into symlinked directories
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.lower().endswith('.srt'):
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            # Broken link: keep it so it is reported as failed
+                            srt_files.append(Path(entry.path))
+                            continue
+                        file_id = (stat.st_dev, stat.st_ino)
+                        if file_id not in seen_files:
+                            seen_files.add(file_id)
+                            srt_files.append(Path(entry.path))
+        except OSError:
+            continue
+
+        # Visit subdirectories depth-first in scan order, matching os.walk
+        pending.extend(reversed(subdirs))
+
     return srt_files
 
-def find_subtitle_pairs(directory: str = ".") -> List[Tuple[Path, Path]]:
+def find_subtitle_pairs(directory: str = ".", srt_files: Optional[List[Path]] = None) -> List[Tuple[Path, Path]]:
     """
     Find pairs of subtitle files (_en.srt and _ru.srt).
 
     Args:
         directory: Directory to search in
+        srt_files: Already discovered .srt files; the directory is scanned if omitted
 
     Returns:
         List of tuples (en_file, ru_file)
     """
-    srt_files = find_srt_files(directory)
+    if srt_files is None:
+        srt_files = find_srt_files(directory)
     pairs = []
 
     # Group files by their base name (without _en or _ru suffix)
@@ -81,6 +141,41 @@ def contains_music_symbol(text: str) -> bool:
     """
     return 'â™ª' in text or '♪' in text
 
+def _strip_tags(text: str) -> str:
+    """
+    Remove HTML tags (``<...>`` with a non-empty body) from text.
+
+    Equivalent to ``re.sub(r'<[^>]+>', '', text)`` but scans with
+    ``str.find`` and returns the input untouched when it has no ``<``.
+
+    Args:
+        text: Text to strip
+
+    Returns:
+        Text without HTML tags
+    """
+    if '<' not in text:
+        return text
+
+    parts = []
+    copy_from = 0
+    search_from = 0
+    while True:
+        tag_start = text.find('<', search_from)
+        if tag_start < 0:
+            break
+        tag_end = text.find('>', tag_start + 1)
+        if tag_end < 0:
+            break
+        if tag_end == tag_start + 1:
+            # "<>" is not a tag; keep it and look further
+            search_from = tag_end
+            continue
+        parts.append(text[copy_from:tag_start])
+        copy_from = search_from = tag_end + 1
+    parts.append(text[copy_from:])
+    return ''.join(parts)
+
 def is_single_character(text: str) -> bool:
     """
     Check if text contains only one character after cleaning HTML tags.
@@ -91,10 +186,13 @@ def is_single_character(text: str) -> bool:
     Returns:
         True if text is a single character, False otherwise
     """
-    # Remove HTML tags
-    cleaned = re.sub(r'<[^>]+>', '', text)
     # Remove whitespace
-    cleaned = cleaned.strip()
+    cleaned = text.strip()
+    # Without tags the length decides; a tagged block can still wrap one character
+    if '<' not in cleaned:
+        return len(cleaned) == 1
+    # Remove HTML tags
+    cleaned = _strip_tags(cleaned).strip()
     # Check if it's a single character
     return len(cleaned) == 1
 
@@ -108,6 +206,14 @@ def parse_time_to_ms(time_str: str) -> int:
     Returns:
         Time in milliseconds
     """
+    # Fast path for the fixed-width "HH:MM:SS,mmm" form: read all nine digits as one integer
+    if len(time_str) == 12 and time_str[2] == ':' and time_str[5] == ':' and time_str[8] in ',.':
+        digits = time_str[0:2] + time_str[3:5] + time_str[6:8] + time_str[9:12]
+        if digits.isascii() and digits.isdigit():
+            value = int(digits)  # HHMMSSmmm
+            return ((value // 10000000) * 3600000 + (value // 100000 % 100) * 60000
+                    + (value // 1000 % 100) * 1000 + value % 1000)
+
     # Handle both comma and period as millisecond separator
     time_str = time_str.replace(',', '.')
     parts = time_str.split(':')
@@ -178,29 +284,126 @@ def clean_text(text: str) -> str:
         Cleaned text
     """
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
-    
+    return _clean_untagged_text(_strip_tags(text))
+
+def _clean_untagged_text(text: str) -> str:
+    """
+    Finish cleaning text whose HTML tags were already removed.
+
+    Args:
+        text: Subtitle text without HTML tags
+
+    Returns:
+        Cleaned text
+    """
     # Remove content in parentheses, brackets, and braces
-    text = re.sub(r'\([^)]*\)', '', text)
-    text = re.sub(r'\[[^\]]*\]', '', text)
-    text = re.sub(r'\{[^}]*\}', '', text)
+    if '(' in text or '[' in text or '{' in text:
+        text = _BRACKETED.sub('', text)
     
     # Clean up extra whitespace first
     text = ' '.join(text.split())
     
-    # Remove dashes at the beginning of lines
+    # Remove dashes at the beginning and end of lines
     # Handle cases like "- -", "- ", "-", "–", etc.
-    text = re.sub(r'^[-â€""]+\s*', '', text)
-    
-    # Remove dashes at the end of lines
-    text = re.sub(r'\s*[-â€""]+$', '', text)
-    
-    # Final cleanup of whitespace
-    text = text.strip()
-    
-    return text
+    return text.lstrip(_EDGE_CHARS).rstrip(_EDGE_CHARS)
 
-def parse_srt_file(file_path: Path) -> List[Tuple[int, str, str, str]]:
+def detect_encoding(head: bytes) -> str:
+    """
+    Pick the text encoding of a subtitle file from its byte order mark.
+
+    Args:
+        head: First bytes of the file
+
+    Returns:
+        Codec name; UTF-8 when there is no BOM (undecodable bytes are ignored)
+    """
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    return 'utf-8'
+
+# States of the SRT block parser
+_EXPECT_INDEX = 0
+_EXPECT_TIME = 1
+_IN_TEXT = 2
+_SKIP_BLOCK = 3
+
+def _parse_srt_lines(lines: Iterable[str]) -> List[SubtitleEntry]:
+    """
+    Parse SRT content line by line, holding only the current block in memory.
+
+    Each block is an index line, a time line ("start --> end") and one or
+    more text lines, terminated by a blank line. Malformed blocks and blocks
+    with music notation are skipped up to the next blank line. Each kept
+    block's text is cleaned and its times are converted to milliseconds
+    once here, then carried along for later stages.
+
+    Args:
+        lines: Iterable of lines (e.g. an open text file)
+
+    Returns:
+        List of tuples (index, start_time, end_time, text, cleaned_text, start_ms, end_ms)
+    """
+    entries = []
+    state = _EXPECT_INDEX
+    index = 0
+    start_time = end_time = ''
+    start_ms = end_ms = 0
+    text_lines: List[str] = []
+
+    # A trailing blank line flushes the last block
+    for line in chain(lines, ('',)):
+        stripped = line.strip()
+
+        if not stripped:
+            if state == _IN_TEXT and text_lines:
+                text_lines[-1] = text_lines[-1].rstrip()
+                text = '\n'.join(text_lines)
+
+                # Strip tags once for both the single-character check and cleaning
+                untagged = _strip_tags(text)
+
+                # Skip this entry if it's a single character
+                if len(untagged.strip()) != 1:
+                    # Interned so repeated lines compare by identity when merging
+                    cleaned_text = sys.intern(_clean_untagged_text(untagged))
+                    entries.append((index, start_time, end_time, text, cleaned_text, start_ms, end_ms))
+            state = _EXPECT_INDEX
+            continue
+
+        if state == _IN_TEXT:
+            # Skip the whole block as soon as a line contains the music symbol
+            if contains_music_symbol(line):
+                state = _SKIP_BLOCK
+            else:
+                text_lines.append(line[:-1] if line.endswith('\n') else line)
+        elif state == _EXPECT_INDEX:
+            try:
+                index = int(stripped)
+                state = _EXPECT_TIME
+            except ValueError:
+                state = _SKIP_BLOCK
+        elif state == _EXPECT_TIME:
+            # Exactly one " --> " separator is required
+            arrow = stripped.find(' --> ')
+            if arrow < 0 or stripped.find(' --> ', arrow + 5) >= 0:
+                state = _SKIP_BLOCK
+            else:
+                start_time = stripped[:arrow].strip()
+                end_time = stripped[arrow + 5:].strip()
+                try:
+                    start_ms = parse_time_to_ms(start_time)
+                    end_ms = parse_time_to_ms(end_time)
+                except ValueError:
+                    state = _SKIP_BLOCK
+                    continue
+                text_lines = []
+                state = _IN_TEXT
+
+    return entries
+
+def parse_srt_file(file_path: Path) -> List[SubtitleEntry]:
     """
     Parse an SRT file into a list of subtitle entries.
     
@@ -208,109 +411,219 @@ def parse_srt_file(file_path: Path) -> List[Tuple[int, str, str, str]]:
         file_path: Path to the SRT file
         
     Returns:
-        List of tuples (index, start_time, end_time, text)
+        List of tuples (index, start_time, end_time, text, cleaned_text, start_ms, end_ms)
     """
-    entries = []
-    
-    try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-    except UnicodeDecodeError:
-        # Try with different encodings
-        for encoding in ['latin1', 'cp1252', 'iso-8859-1']:
-            try:
-                with open(file_path, 'r', encoding=encoding, errors='ignore') as f:
-                    content = f.read()
-                break
-            except UnicodeDecodeError:
-                continue
-        else:
-            print(f"Warning: Could not decode {file_path}")
-            return entries
-    
-    # Split into blocks
-    blocks = re.split(r'\n\s*\n', content.strip())
-    
-    for block in blocks:
-        if not block.strip():
-            continue
-            
-        lines = block.strip().split('\n')
-        if len(lines) < 3:
-            continue
-            
-        try:
-            # Parse index
-            index = int(lines[0].strip())
-            
-            # Parse time range
-            time_line = lines[1].strip()
-            if ' --> ' not in time_line:
-                continue
-            start_time, end_time = time_line.split(' --> ')
-            
-            # Parse text (everything after the time line)
-            text_lines = lines[2:]
-            text = '\n'.join(text_lines)
-            
-            # Skip this entry if it contains the music symbol
-            if contains_music_symbol(text):
-                continue
-            
-            # Skip this entry if it's a single character
-            if is_single_character(text):
-                continue
-            
-            entries.append((index, start_time.strip(), end_time.strip(), text))
-            
-        except (ValueError, IndexError):
-            continue
-    
-    return entries
+    with open(file_path, 'rb') as raw:
+        encoding = detect_encoding(raw.read(4))
+        raw.seek(0)
+        with io.TextIOWrapper(raw, encoding=encoding, errors='ignore') as f:
+            return _parse_srt_lines(f)
 
-def merge_consecutive_duplicates(entries: List[Tuple[int, str, str, str]]) -> List[Tuple[int, str, str, str]]:
+def merge_consecutive_duplicates(entries: List[SubtitleEntry]) -> List[SubtitleEntry]:
     """
     Merge consecutive entries with identical cleaned text.
 
     Args:
-        entries: List of subtitle entries
+        entries: List of parsed subtitle entries with their cleaned text
 
     Returns:
-        List with merged entries
+        List with merged entries as tuples (index, start_time, end_time, text, cleaned_text, start_ms, end_ms)
     """
     if not entries:
-        return entries
-
-    merged = []
-    current_entry = list(entries[0])  # [index, start_time, end_time, text]
-    current_cleaned_text = clean_text(current_entry[3])
+        return []
 
-    for i in range(1, len(entries)):
-        entry = entries[i]
-        cleaned_text = clean_text(entry[3])
+    merged: List[SubtitleEntry] = []
+    _, current_start, current_end, current_text, current_cleaned_text, current_start_ms, current_end_ms = entries[0]
 
+    for _, start_time, end_time, text, cleaned_text, start_ms, end_ms in entries[1:]:
         # If the cleaned text matches the current entry, merge them
-        if cleaned_text == current_cleaned_text and cleaned_text.strip():
+        if cleaned_text == current_cleaned_text and cleaned_text:
             # Update end time to the end time of the current entry
-            current_entry[2] = entry[2]
+            current_end, current_end_ms = end_time, end_ms
         else:
-            # Add the current merged entry and start a new one
-            merged.append(tuple(current_entry))
-            current_entry = list(entry)
+            # Add the current merged entry (numbered sequentially) and start a new one
+            merged.append((len(merged) + 1, current_start, current_end, current_text, current_cleaned_text,
+                           current_start_ms, current_end_ms))
+            current_start, current_end, current_text = start_time, end_time, text
             current_cleaned_text = cleaned_text
+            current_start_ms, current_end_ms = start_ms, end_ms
 
     # Add the last entry
-    merged.append(tuple(current_entry))
+    merged.append((len(merged) + 1, current_start, current_end, current_text, current_cleaned_text,
+                   current_start_ms, current_end_ms))
+
+    return merged
+
+def _is_monotonic(starts: List[int], ends: List[int]) -> bool:
+    """
+    Check that intervals are sorted by start time and their end times never decrease.
 
-    # Re-index the entries
-    reindexed = []
-    for i, (_, start_time, end_time, text) in enumerate(merged, 1):
-        reindexed.append((i, start_time, end_time, text))
+    Args:
+        starts: Interval start times in milliseconds
+        ends: Interval end times in milliseconds
 
-    return reindexed
+    Returns:
+        True if both sequences are non-decreasing, False otherwise
+    """
+    return all(starts[k] <= starts[k + 1] and ends[k] <= ends[k + 1] for k in range(len(starts) - 1))
 
-def synchronize_subtitle_pairs(entries_a: List[Tuple[int, str, str, str]],
-                               entries_b: List[Tuple[int, str, str, str]]) -> Tuple[List[Tuple[int, str, str, str]], List[Tuple[int, str, str, str]]]:
+def _intervals_aligned(entries_a: List[SubtitleEntry], entries_b: List[SubtitleEntry]) -> bool:
+    """
+    Check whether two lists have identical intervals with strictly increasing start and end times.
+
+    Such intervals never contain one another, so synchronization cannot merge anything.
+
+    Args:
+        entries_a: First list of subtitle entries
+        entries_b: Second list of subtitle entries
+
+    Returns:
+        True if both lists are already synchronized, False otherwise
+    """
+    if len(entries_a) != len(entries_b):
+        return False
+
+    previous_start = previous_end = -1
+    for a, b in zip(entries_a, entries_b):
+        start_ms, end_ms = a[5], a[6]
+        if start_ms != b[5] or end_ms != b[6] or start_ms <= previous_start or end_ms <= previous_end:
+            return False
+        previous_start, previous_end = start_ms, end_ms
+    return True
+
+def _first_containing(outer_starts: List[int], outer_ends: List[int],
+                      inner_starts: List[int], inner_ends: List[int]) -> List[int]:
+    """
+    Find, for every inner interval, the first outer interval (in list order) that contains it.
+
+    Works for any ordering of either list in O((N + M) log N): inner intervals are
+    visited by start time while outer intervals are added once their start is reached,
+    and a Fenwick tree over outer end times (latest first) yields the lowest index
+    among added intervals that end late enough.
+
+    Args:
+        outer_starts, outer_ends: Outer intervals in milliseconds
+        inner_starts, inner_ends: Inner intervals in milliseconds
+
+    Returns:
+        Outer index for each inner interval, or -1 if no outer interval contains it
+    """
+    num_outer = len(outer_starts)
+    ends_ascending = sorted(set(outer_ends))
+    num_ends = len(ends_ascending)
+    # Rank 1 is the latest end time, so a prefix of ranks covers all ends >= a bound
+    end_rank = {end: num_ends - position for position, end in enumerate(ends_ascending)}
+    tree = [num_outer] * (num_ends + 1)  # prefix minimum of outer indexes
+
+    outer_order = sorted(range(num_outer), key=outer_starts.__getitem__)
+    added = 0
+    result = [-1] * len(inner_starts)
+
+    for i in sorted(range(len(inner_starts)), key=inner_starts.__getitem__):
+        start_ms = inner_starts[i]
+
+        # Add every outer interval that starts no later than this inner interval
+        while added < num_outer and outer_starts[outer_order[added]] <= start_ms:
+            k = outer_order[added]
+            rank = end_rank[outer_ends[k]]
+            while rank <= num_ends:
+                if k < tree[rank]:
+                    tree[rank] = k
+                rank += rank & -rank
+            added += 1
+
+        # Lowest index among added intervals ending at or after this one
+        best = num_outer
+        rank = num_ends - bisect_left(ends_ascending, inner_ends[i])
+        while rank > 0:
+            if tree[rank] < best:
+                best = tree[rank]
+            rank -= rank & -rank
+        if best < num_outer:
+            result[i] = best
+
+    return result
+
+def _merge_contained(outer: List[SubtitleEntry],
+                     inner: List[SubtitleEntry]) -> Tuple[List[SubtitleEntry], bool]:
+    """
+    Merge runs of consecutive inner entries that fall within a single outer entry.
+
+    Each inner entry is matched against the first outer entry (in list order)
+    that contains it; the following inner entries contained in the same outer
+    entry are merged with it, taking the outer entry's time range.
+
+    Args:
+        outer: Entries whose intervals act as containers
+        inner: Entries to merge
+
+    Returns:
+        Tuple of (new inner entries, whether anything was merged)
+    """
+    outer_starts = [e[5] for e in outer]
+    outer_ends = [e[6] for e in outer]
+    inner_starts = [e[5] for e in inner]
+    inner_ends = [e[6] for e in inner]
+    num_outer = len(outer)
+    num_inner = len(inner)
+
+    # When the outer list is monotonic, the first outer entry containing an inner
+    # interval is the first one whose end reaches it, found by binary search on the
+    # end times. If the inner list is monotonic too, that position only moves forward,
+    # so each search resumes from the previous one. Otherwise (overlapping or unsorted
+    # cues) all containing entries are looked up up front.
+    outer_sorted = _is_monotonic(outer_starts, outer_ends)
+    inner_sorted = _is_monotonic(inner_starts, inner_ends)
+    first_containing: List[int] = [] if outer_sorted else _first_containing(outer_starts, outer_ends,
+                                                                             inner_starts, inner_ends)
+
+    result = []
+    changed = False
+    k = 0
+    i = 0
+
+    while i < num_inner:
+        start_ms = inner_starts[i]
+        end_ms = inner_ends[i]
+
+        # Find the outer entry that contains the current inner entry
+        containing = -1
+        if outer_sorted:
+            k = bisect_left(outer_ends, end_ms, k if inner_sorted else 0)
+            if k < num_outer and outer_starts[k] <= start_ms:
+                containing = k
+        else:
+            containing = first_containing[i]
+
+        if containing < 0:
+            result.append(inner[i])
+            i += 1
+            continue
+
+        # Collect all following inner entries contained in the same outer entry
+        outer_start_ms = outer_starts[containing]
+        outer_end_ms = outer_ends[containing]
+        next_index = i + 1
+        while next_index < num_inner and interval_contains(outer_start_ms, outer_end_ms,
+                                                           inner_starts[next_index], inner_ends[next_index]):
+            next_index += 1
+
+        # If we found multiple inner entries within one outer entry, merge them
+        if next_index - i > 1:
+            changed = True
+            # Merge texts with space separator, using the time range of the outer entry
+            merged_text = ' '.join(entry[4] for entry in inner[i:next_index])
+            containing_entry = outer[containing]
+            result.append((0, containing_entry[1], containing_entry[2], merged_text, clean_text(merged_text),
+                           containing_entry[5], containing_entry[6]))
+        else:
+            result.append(inner[i])
+        i = next_index
+
+    return result, changed
+
+def synchronize_subtitle_pairs(entries_a: List[SubtitleEntry],
+                               entries_b: List[SubtitleEntry]) -> Tuple[List[SubtitleEntry], List[SubtitleEntry]]:
     """
     Synchronize two subtitle lists by merging entries that fall within the same time interval.
 
@@ -318,8 +631,8 @@ def synchronize_subtitle_pairs(entries_a: List[Tuple[int, str, str, str]],
     The process continues iteratively until no more merges are needed.
 
     Args:
-        entries_a: First list of subtitle entries (e.g., English)
-        entries_b: Second list of subtitle entries (e.g., Russian)
+        entries_a: First list of cleaned subtitle entries (e.g., English)
+        entries_b: Second list of cleaned subtitle entries (e.g., Russian)
 
     Returns:
         Tuple of synchronized (entries_a, entries_b)
@@ -327,169 +640,76 @@ def synchronize_subtitle_pairs(entries_a: List[Tuple[int, str, str, str]],
     if not entries_a or not entries_b:
         return entries_a, entries_b
 
-    max_iterations = 10
-    iteration = 0
-
-    while iteration < max_iterations:
-        changed = False
-        iteration += 1
+    # A merge in one list can enable another in the other list, so repeat
+    # until a round changes nothing. Already aligned lists need no rounds.
+    max_iterations = 0 if _intervals_aligned(entries_a, entries_b) else 10
 
+    for _ in range(max_iterations):
         # Process list B: merge entries that are contained within a single entry in A
-        new_b = []
-        b_index = 0
-
-        while b_index < len(entries_b):
-            # Find entries in A that might contain multiple B entries
-            current_b = entries_b[b_index]
-            b_start_ms = parse_time_to_ms(current_b[1])
-            b_end_ms = parse_time_to_ms(current_b[2])
-
-            # Find the A entry that overlaps with current B entry
-            containing_a = None
-            for a_entry in entries_a:
-                a_start_ms = parse_time_to_ms(a_entry[1])
-                a_end_ms = parse_time_to_ms(a_entry[2])
-
-                if interval_contains(a_start_ms, a_end_ms, b_start_ms, b_end_ms):
-                    containing_a = a_entry
-                    break
-
-            if containing_a:
-                a_start_ms = parse_time_to_ms(containing_a[1])
-                a_end_ms = parse_time_to_ms(containing_a[2])
-
-                # Collect all B entries that are contained in this A entry
-                entries_to_merge = [current_b]
-                next_index = b_index + 1
-
-                while next_index < len(entries_b):
-                    next_b = entries_b[next_index]
-                    next_b_start_ms = parse_time_to_ms(next_b[1])
-                    next_b_end_ms = parse_time_to_ms(next_b[2])
-
-                    if interval_contains(a_start_ms, a_end_ms, next_b_start_ms, next_b_end_ms):
-                        entries_to_merge.append(next_b)
-                        next_index += 1
-                    else:
-                        break
-
-                # If we found multiple B entries within one A entry, merge them
-                if len(entries_to_merge) > 1:
-                    changed = True
-                    # Merge texts with space separator
-                    merged_text = ' '.join(clean_text(entry[3]) for entry in entries_to_merge)
-                    # Use the time range of the containing A entry
-                    merged_entry = (0, containing_a[1], containing_a[2], merged_text)
-                    new_b.append(merged_entry)
-                    b_index = next_index
-                else:
-                    new_b.append(current_b)
-                    b_index += 1
-            else:
-                new_b.append(current_b)
-                b_index += 1
-
-        entries_b = new_b
+        entries_b, changed_b = _merge_contained(entries_a, entries_b)
 
         # Process list A: merge entries that are contained within a single entry in B
-        new_a = []
-        a_index = 0
-
-        while a_index < len(entries_a):
-            current_a = entries_a[a_index]
-            a_start_ms = parse_time_to_ms(current_a[1])
-            a_end_ms = parse_time_to_ms(current_a[2])
-
-            # Find the B entry that overlaps with current A entry
-            containing_b = None
-            for b_entry in entries_b:
-                b_start_ms = parse_time_to_ms(b_entry[1])
-                b_end_ms = parse_time_to_ms(b_entry[2])
-
-                if interval_contains(b_start_ms, b_end_ms, a_start_ms, a_end_ms):
-                    containing_b = b_entry
-                    break
-
-            if containing_b:
-                b_start_ms = parse_time_to_ms(containing_b[1])
-                b_end_ms = parse_time_to_ms(containing_b[2])
-
-                # Collect all A entries that are contained in this B entry
-                entries_to_merge = [current_a]
-                next_index = a_index + 1
-
-                while next_index < len(entries_a):
-                    next_a = entries_a[next_index]
-                    next_a_start_ms = parse_time_to_ms(next_a[1])
-                    next_a_end_ms = parse_time_to_ms(next_a[2])
-
-                    if interval_contains(b_start_ms, b_end_ms, next_a_start_ms, next_a_end_ms):
-                        entries_to_merge.append(next_a)
-                        next_index += 1
-                    else:
-                        break
-
-                # If we found multiple A entries within one B entry, merge them
-                if len(entries_to_merge) > 1:
-                    changed = True
-                    # Merge texts with space separator
-                    merged_text = ' '.join(clean_text(entry[3]) for entry in entries_to_merge)
-                    # Use the time range of the containing B entry
-                    merged_entry = (0, containing_b[1], containing_b[2], merged_text)
-                    new_a.append(merged_entry)
-                    a_index = next_index
-                else:
-                    new_a.append(current_a)
-                    a_index += 1
-            else:
-                new_a.append(current_a)
-                a_index += 1
-
-        entries_a = new_a
+        entries_a, changed_a = _merge_contained(entries_b, entries_a)
 
         # If no changes were made, we're done
-        if not changed:
+        if not changed_a and not changed_b:
             break
 
     # Re-index both lists
-    reindexed_a = []
-    for i, (_, start_time, end_time, text) in enumerate(entries_a, 1):
-        reindexed_a.append((i, start_time, end_time, text))
-
-    reindexed_b = []
-    for i, (_, start_time, end_time, text) in enumerate(entries_b, 1):
-        reindexed_b.append((i, start_time, end_time, text))
+    reindexed_a = [(i, *entry[1:]) for i, entry in enumerate(entries_a, 1)]
+    reindexed_b = [(i, *entry[1:]) for i, entry in enumerate(entries_b, 1)]
 
     return reindexed_a, reindexed_b
 
-def write_srt_file(file_path: Path, entries: List[Tuple[int, str, str, str]]) -> None:
+def write_srt_file(file_path: Path, entries: List[SubtitleEntry]) -> int:
     """
     Write subtitle entries to an SRT file with proper sequential numbering.
+
+    The file is left untouched when it already holds exactly this content.
     
     Args:
         file_path: Path to write the SRT file
-        entries: List of subtitle entries
+        entries: List of subtitle entries with their cleaned text
+
+    Returns:
+        Number of entries written
     """
-    with open(file_path, 'w', encoding='utf-8') as f:
-        entry_number = 1
-        
-        for i, (_, start_time, end_time, text) in enumerate(entries):
-            # Clean the text
-            cleaned_text = clean_text(text)
-            
-            # Skip empty entries
-            if not cleaned_text.strip():
-                continue
-            
-            f.write(f"{entry_number}\n")
-            f.write(f"{start_time} --> {end_time}\n")
-            f.write(f"{cleaned_text}\n")
-            
-            # Add blank line between entries (except for the last one)
-            if i < len(entries) - 1:
-                f.write("\n")
-            
-            entry_number += 1
+    parts = []
+    entry_number = 1
+    last_index = len(entries) - 1
+
+    for i, (_, start_time, end_time, _, cleaned_text, _, _) in enumerate(entries):
+        # Skip empty entries
+        if not cleaned_text:
+            continue
+
+        parts.append(f"{entry_number}\n{start_time} --> {end_time}\n{cleaned_text}\n")
+
+        # Add blank line between entries (except for the last one)
+        if i < last_index:
+            parts.append("\n")
+
+        entry_number += 1
+
+    # Encode once, with the platform line endings text mode would produce
+    content = ''.join(parts)
+    if os.linesep != '\n':
+        content = content.replace('\n', os.linesep)
+    data = content.encode('utf-8')
+
+    # Skip the write if the file is already clean (size check first, then bytes)
+    try:
+        if os.path.getsize(file_path) == len(data):
+            with open(file_path, 'rb') as f:
+                if f.read() == data:
+                    return entry_number - 1
+    except OSError:
+        pass
+
+    with open(file_path, 'wb') as f:
+        f.write(data)
+
+    return entry_number - 1
 
 def repair_srt_file(file_path: Path) -> Tuple[bool, str, int, int]:
     """
@@ -518,9 +738,7 @@ def repair_srt_file(file_path: Path) -> Tuple[bool, str, int, int]:
         merged_entries = merge_consecutive_duplicates(entries)
 
         # Write repaired file
-        write_srt_file(file_path, merged_entries)
-
-        final_count = len([e for e in merged_entries if clean_text(e[3]).strip()])
+        final_count = write_srt_file(file_path, merged_entries)
 
         return (True, str(file_path), original_count, final_count)
 
@@ -540,28 +758,25 @@ def process_subtitle_pair(en_file: Path, ru_file: Path) -> Tuple[bool, str, int,
     """
     try:
         # Parse both files
-        en_entries = parse_srt_file(en_file)
-        ru_entries = parse_srt_file(ru_file)
+        en_parsed = parse_srt_file(en_file)
+        ru_parsed = parse_srt_file(ru_file)
 
-        if not en_entries or not ru_entries:
+        if not en_parsed or not ru_parsed:
             return (False, f"{en_file.stem}/{ru_file.stem}", 0, 0, 0, 0)
 
-        en_original = len(en_entries)
-        ru_original = len(ru_entries)
+        en_original = len(en_parsed)
+        ru_original = len(ru_parsed)
 
         # Merge consecutive duplicates in each file
-        en_entries = merge_consecutive_duplicates(en_entries)
-        ru_entries = merge_consecutive_duplicates(ru_entries)
+        en_entries = merge_consecutive_duplicates(en_parsed)
+        ru_entries = merge_consecutive_duplicates(ru_parsed)
 
         # Synchronize the two subtitle lists
         en_entries, ru_entries = synchronize_subtitle_pairs(en_entries, ru_entries)
 
         # Write repaired files
-        write_srt_file(en_file, en_entries)
-        write_srt_file(ru_file, ru_entries)
-
-        en_final = len([e for e in en_entries if clean_text(e[3]).strip()])
-        ru_final = len([e for e in ru_entries if clean_text(e[3]).strip()])
+        en_final = write_srt_file(en_file, en_entries)
+        ru_final = write_srt_file(ru_file, ru_entries)
 
         return (True, f"{en_file.stem}/{ru_file.stem}", en_original, en_final, ru_original, ru_final)
 
@@ -593,87 +808,112 @@ def process_file_wrapper(file_path: Path) -> Tuple[bool, str, int, int]:
     """
     return repair_srt_file(file_path)
 
-def main():
+def get_chunksize(num_tasks: int, num_processes: int) -> int:
+    """
+    Pick a Pool chunksize that gives each worker about four batches.
+
+    Each chunk is pickled to a worker as one task and its results come back
+    as one message, so larger chunks amortize IPC across many small files.
+    The size is capped at MAX_CHUNKSIZE to keep results streaming.
+
+    Args:
+        num_tasks: Number of items to process
+        num_processes: Number of worker processes
+
+    Returns:
+        Chunksize for imap_unordered (between 1 and MAX_CHUNKSIZE)
+    """
+    return max(1, min(MAX_CHUNKSIZE, num_tasks // (num_processes * 4)))
+
+def main() -> None:
     """Main function to repair all SRT files using multiprocessing with pair synchronization."""
+    parser = argparse.ArgumentParser(description="Repair .srt files and synchronize _en/_ru pairs.")
+    parser.add_argument("--workers", type=int, default=cpu_count(),
+                        help="Number of worker processes (default: CPU count)")
+    args = parser.parse_args()
+    max_workers = max(1, args.workers)
+
     print("SRT File Repair Tool with Pair Synchronization (Multi-core)")
     print("=============================================================")
     print("Searching for .srt file pairs...")
 
-    # Find subtitle pairs (_en.srt and _ru.srt)
-    subtitle_pairs = find_subtitle_pairs()
-
-    if not subtitle_pairs:
-        print("No subtitle pairs (_en.srt and _ru.srt) found.")
-        print()
-    else:
-        print(f"Found {len(subtitle_pairs)} subtitle pair(s)")
-        print(f"Using 8 cores for processing...")
-        print()
-
-        # Process pairs using multiprocessing with 8 cores
-        num_processes = min(8, len(subtitle_pairs))
-
-        with Pool(processes=num_processes) as pool:
-            pair_results = pool.map(process_pair_wrapper, subtitle_pairs)
-
-        # Display pair results
-        pair_success_count = 0
-        for success, pair_name, en_orig, en_final, ru_orig, ru_final in pair_results:
-            if success:
-                print(f"✓ {pair_name}")
-                print(f"  EN: {en_orig} → {en_final} entries")
-                print(f"  RU: {ru_orig} → {ru_final} entries")
-                pair_success_count += 1
-            else:
-                print(f"✗ {pair_name}")
-                if en_orig == 0 and ru_orig == 0:
-                    print(f"  No valid entries found")
-                else:
-                    print(f"  Error during processing")
-            print()
-
-        print(f"Pair processing completed: {pair_success_count}/{len(subtitle_pairs)} pairs processed successfully")
-        print()
+    # Scan the tree once and split it into subtitle pairs (_en.srt and _ru.srt) and single files
+    srt_files = find_srt_files()
+    subtitle_pairs = find_subtitle_pairs(srt_files=srt_files)
 
-    # Find and process single files (files not in pairs)
-    all_srt_files = set(find_srt_files())
     paired_files = set()
     for en_file, ru_file in subtitle_pairs:
         paired_files.add(en_file)
         paired_files.add(ru_file)
 
-    single_files = list(all_srt_files - paired_files)
+    single_files = [file_path for file_path in srt_files if file_path not in paired_files]
 
-    if not single_files:
-        print("No single .srt files found (all files are in pairs).")
-    else:
-        print(f"Found {len(single_files)} single .srt file(s)")
-        print(f"Processing single files...")
-        print()
+    # One pool serves both phases, using one worker per core (or --workers)
+    num_processes = min(max_workers, max(len(subtitle_pairs), len(single_files), 1))
 
-        # Process single files using multiprocessing
-        num_processes = min(8, len(single_files))
+    # Forked workers inherit the already imported module instead of re-importing it
+    # (Python 3.14 no longer forks by default on Linux); other platforms keep their default
+    context = get_context('fork' if sys.platform.startswith('linux') else None)
 
-        with Pool(processes=num_processes) as pool:
-            single_results = pool.map(process_file_wrapper, single_files)
+    with context.Pool(processes=num_processes) as pool:
+        if not subtitle_pairs:
+            print("No subtitle pairs (_en.srt and _ru.srt) found.")
+            print()
+        else:
+            print(f"Found {len(subtitle_pairs)} subtitle pair(s)")
+            print(f"Using {num_processes} processes...")
+            print()
 
-        # Display single file results
-        single_success_count = 0
-        for success, file_path, original_count, final_count in single_results:
-            if success:
-                print(f"✓ {file_path}")
-                print(f"  {original_count} → {final_count} entries")
-                single_success_count += 1
-            else:
-                print(f"✗ {file_path}")
-                if original_count == 0:
-                    print(f"  No valid entries found")
+            chunksize = get_chunksize(len(subtitle_pairs), num_processes)
+
+            # Display pair results as they complete
+            pair_success_count = 0
+            pair_results = pool.imap_unordered(process_pair_wrapper, subtitle_pairs, chunksize=chunksize)
+            for success, pair_name, en_orig, en_final, ru_orig, ru_final in pair_results:
+                if success:
+                    print(f"✓ {pair_name}")
+                    print(f"  EN: {en_orig} → {en_final} entries")
+                    print(f"  RU: {ru_orig} → {ru_final} entries")
+                    pair_success_count += 1
                 else:
-                    print(f"  Error during processing")
+                    print(f"✗ {pair_name}")
+                    if en_orig == 0 and ru_orig == 0:
+                        print(f"  No valid entries found")
+                    else:
+                        print(f"  Error during processing")
+                print()
+
+            print(f"Pair processing completed: {pair_success_count}/{len(subtitle_pairs)} pairs processed successfully")
+            print()
+
+        if not single_files:
+            print("No single .srt files found (all files are in pairs).")
+        else:
+            print(f"Found {len(single_files)} single .srt file(s)")
+            print(f"Processing single files...")
             print()
 
-        print(f"Single file processing completed: {single_success_count}/{len(single_files)} files processed successfully")
-        print()
+            # Process single files with the same pool
+            chunksize = get_chunksize(len(single_files), num_processes)
+
+            # Display single file results as they complete
+            single_success_count = 0
+            single_results = pool.imap_unordered(process_file_wrapper, single_files, chunksize=chunksize)
+            for success, file_path, original_count, final_count in single_results:
+                if success:
+                    print(f"✓ {file_path}")
+                    print(f"  {original_count} → {final_count} entries")
+                    single_success_count += 1
+                else:
+                    print(f"✗ {file_path}")
+                    if original_count == 0:
+                        print(f"  No valid entries found")
+                    else:
+                        print(f"  Error during processing")
+                print()
+
+            print(f"Single file processing completed: {single_success_count}/{len(single_files)} files processed successfully")
+            print()
 
     print("All processing completed!")
     print("Note: Backup files (.srt.backup) creation is currently disabled.")
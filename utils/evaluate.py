@@ -7,11 +7,18 @@ and evaluates how well they match using an LLM (OpenRouter or LMStudio).
 """
 
 import os
+import re
 import sys
 import argparse
 import random
 import json
-from typing import List, Dict, Tuple
+import hashlib
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Callable, List, Dict, Optional, Tuple
 from pathlib import Path
 
 # Add backend to path to import SRT parser
@@ -20,174 +27,547 @@ sys.path.insert(0, str(backend_path))
 
 from infrastructure.srt_parser import parse_srt, match_cues, Cue
 
+# orjson is optional; it encodes Russian text as raw UTF-8 and parses replies in C
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    _json_loads = json.loads
+
+# tqdm is optional; without it evaluation runs without a progress bar
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+# First one- or two-digit number in the model's reply
+_SCORE_RE = re.compile(r'\d{1,2}')
+
+# Punctuation and whitespace ignored when comparing texts for trivial pairs
+_NON_WORD_RE = re.compile(r'\W+')
+
 
 # ============================================================================
 # LLM Evaluators
 # ============================================================================
 
+def _create_session(pool_size: int = 16):
+    """
+    Create a requests session that keeps connections alive between calls.
+
+    Args:
+        pool_size: Maximum number of pooled connections per host
+
+    Returns:
+        Configured requests.Session
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Jitter source kept apart from the seeded sampling RNG
+_JITTER = random.Random()
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None, max_delay: float = 30.0) -> float:
+    """
+    Compute how long to wait before retrying a failed request.
+
+    Args:
+        attempt: Zero-based number of the failed attempt
+        retry_after: Retry-After header value, if the server sent one
+        max_delay: Upper bound for any delay, including Retry-After
+
+    Returns:
+        Delay in seconds (full-jitter exponential backoff unless Retry-After is given)
+    """
+    if retry_after is not None:
+        try:
+            # Clamped so a long Retry-After cannot block a worker for hours
+            return min(max_delay, max(0.0, float(retry_after)))
+        except ValueError:
+            pass  # HTTP-date form, fall back to backoff
+    return _JITTER.uniform(0, min(max_delay, 2 ** attempt))
+
+
+# Scoring scale shared by the single-pair and grouped prompts
+_SCALE_DESCRIPTION = """- 1-3: Плохое соответствие (смысл полностью искажен или тексты не связаны)
+- 4-6: Среднее соответствие (общий смысл передан, но есть заметные расхождения)
+- 7-9: Хорошее соответствие (точный перевод с небольшими различиями)
+- 10: Отличное соответствие (практически идеальный перевод)"""
+
+
+def _parse_group_scores(content: str, count: int) -> List[int]:
+    """
+    Parse the JSON reply to a grouped prompt.
+
+    Args:
+        content: Model reply containing {"scores": [{"id": ..., "score": ...}, ...]}
+        count: Number of pairs in the group
+
+    Returns:
+        Scores ordered by id (-1 for ids missing from the reply)
+    """
+    # Tolerate Markdown code fences or chatter around the JSON object
+    start = content.find("{")
+    end = content.rfind("}")
+    if start < 0 or end < start:
+        raise ValueError(f"no JSON object in response: {content[:80]!r}")
+
+    scores = [-1] * count
+    for item in _json_loads(content[start:end + 1])["scores"]:
+        try:
+            pair_id = int(item["id"])
+            score = int(item["score"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if 1 <= pair_id <= count:
+            scores[pair_id - 1] = max(1, min(10, score))  # Clamp to 1-10
+    return scores
+
+
+# JSON schemas for structured output of the single-pair and grouped prompts
+_SCORE_SCHEMA = {
+    "type": "object",
+    "properties": {"score": {"type": "integer"}},
+    "required": ["score"],
+    "additionalProperties": False
+}
+_GROUP_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "scores": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"id": {"type": "integer"}, "score": {"type": "integer"}},
+                "required": ["id", "score"],
+                "additionalProperties": False
+            }
+        }
+    },
+    "required": ["scores"],
+    "additionalProperties": False
+}
+
+
 class LLMEvaluator:
     """Base class for LLM evaluators."""
 
-    def evaluate(self, en_text: str, ru_text: str) -> int:
+    # Provider name used in error messages
+    name = "LLM"
+
+    # Attempts per request for rate limits, server errors and network failures
+    max_attempts = 5
+
+    # Set after the provider rejects the credentials; later requests fail fast
+    _fatal_error = None
+
+    # Constrain replies with a JSON schema (response_format) instead of free text
+    structured_output = False
+
+    # Sampling seed sent with every request (None leaves it to the provider)
+    seed = None
+
+    def _build_payload(self, prompt: str, max_tokens: int, schema: Optional[Dict] = None) -> Dict:
         """
-        Evaluate how well the Russian text matches the English text.
+        Build a chat completion request body.
 
         Args:
-            en_text: English subtitle text
-            ru_text: Russian subtitle text
+            prompt: Message content
+            max_tokens: Maximum number of tokens in the reply
+            schema: JSON schema the reply must follow, if any
 
         Returns:
-            Score from 1 to 10
+            Request payload
         """
-        raise NotImplementedError
+        payload = {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "temperature": 0.0,
+            "max_tokens": max_tokens
+        }
+        if self.seed is not None:
+            payload["seed"] = self.seed
+        if schema is not None:
+            payload["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {"name": "evaluation", "strict": True, "schema": schema}
+            }
+        return payload
+
+    def _complete(self, prompt: str, max_tokens: int, schema: Optional[Dict] = None) -> str:
+        """
+        Send a single user message to the model.
 
+        Args:
+            prompt: Message content
+            max_tokens: Maximum number of tokens in the reply
+            schema: JSON schema the reply must follow, if any
 
-class OpenRouterEvaluator(LLMEvaluator):
-    """Evaluator using OpenRouter API."""
+        Returns:
+            Reply text with surrounding whitespace stripped
+        """
+        raise NotImplementedError
 
-    def __init__(self, api_key: str, model: str = "anthropic/claude-3.5-sonnet"):
+    def _post(self, headers: Dict[str, str], payload: Dict, timeout: float) -> Dict:
         """
-        Initialize OpenRouter evaluator.
+        POST a request to base_url through _session, retrying transient failures.
+
+        429 and 5xx responses, timeouts and connection errors are retried with
+        exponential backoff (honoring Retry-After). Other errors are raised at once,
+        and 401/403 also stop all further requests of this evaluator.
 
         Args:
-            api_key: OpenRouter API key
-            model: Model identifier (default: claude-3.5-sonnet)
+            headers: Request headers
+            payload: JSON request body
+            timeout: Request timeout in seconds
+
+        Returns:
+            Decoded JSON response
         """
-        self.api_key = api_key
-        self.model = model
-        self.base_url = "https://openrouter.ai/api/v1/chat/completions"
+        import requests
+
+        for attempt in range(self.max_attempts):
+            if self._fatal_error:
+                raise RuntimeError(self._fatal_error)
+
+            last_attempt = attempt == self.max_attempts - 1
+            retry_after = None
+            try:
+                response = self._session.post(
+                    self.base_url,
+                    headers=headers,
+                    data=_json_dumps(payload),
+                    timeout=timeout
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                if last_attempt:
+                    raise
+            else:
+                status = response.status_code
+                if status in (401, 403):
+                    self._fatal_error = f"{status} credentials rejected, skipping further requests"
+                if (status != 429 and status < 500) or last_attempt:
+                    response.raise_for_status()
+                    return _json_loads(response.content)
+                retry_after = response.headers.get("Retry-After")
+
+            time.sleep(_retry_delay(attempt, retry_after))
 
     def evaluate(self, en_text: str, ru_text: str) -> int:
-        """Evaluate using OpenRouter API."""
-        import requests
+        """
+        Evaluate how well the Russian text matches the English text.
+
+        Args:
+            en_text: English subtitle text
+            ru_text: Russian subtitle text
 
+        Returns:
+            Score from 1 to 10 (-1 if the evaluation failed)
+        """
         prompt = f"""Оцени по шкале от 1 до 10, насколько хорошо русский перевод соответствует английскому тексту из субтитров.
 
 Английский текст: "{en_text}"
 Русский текст: "{ru_text}"
 
 Верни ТОЛЬКО число от 1 до 10, где:
-- 1-3: Плохое соответствие (смысл полностью искажен или тексты не связаны)
-- 4-6: Среднее соответствие (общий смысл передан, но есть заметные расхождения)
-- 7-9: Хорошее соответствие (точный перевод с небольшими различиями)
-- 10: Отличное соответствие (практически идеальный перевод)
+{_SCALE_DESCRIPTION}
 
 Ответ (только число):"""
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-
-        payload = {
-            "model": self.model,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "temperature": 0.3,
-            "max_tokens": 10
-        }
-
         try:
-            response = requests.post(
-                self.base_url,
-                headers=headers,
-                json=payload,
-                timeout=30
-            )
-            response.raise_for_status()
-
-            result = response.json()
-            content = result["choices"][0]["message"]["content"].strip()
+            if self.structured_output:
+                # The reply is {"score": N}; the number is extracted below
+                content = self._complete(prompt, max_tokens=8, schema=_SCORE_SCHEMA)
+            else:
+                # The reply is a single number, "10" at most
+                content = self._complete(prompt, max_tokens=4)
 
             # Extract number from response
-            score = int(''.join(filter(str.isdigit, content))[:2])
+            match = _SCORE_RE.search(content)
+            if match is None:
+                raise ValueError(f"no score in response: {content!r}")
+            score = int(match.group())
             return max(1, min(10, score))  # Clamp to 1-10
 
         except Exception as e:
-            print(f"⚠️  OpenRouter API error: {e}")
+            print(f"⚠️  {self.name} API error: {e}")
             return -1
 
+    def evaluate_group(self, pairs: List[Tuple[str, str]]) -> List[int]:
+        """
+        Evaluate several pairs with a single prompt.
+
+        Saves one round trip and one copy of the instructions per extra pair.
+
+        Args:
+            pairs: List of (en_text, ru_text) tuples
+
+        Returns:
+            Scores in the same order as pairs (-1 for failed evaluations)
+        """
+        items_block = "\n\n".join(
+            f'id: {i}\nАнглийский текст: "{en_text}"\nРусский текст: "{ru_text}"'
+            for i, (en_text, ru_text) in enumerate(pairs, 1)
+        )
+        prompt = f"""Оцени по шкале от 1 до 10, насколько хорошо русский перевод соответствует английскому тексту для каждой из {len(pairs)} пар субтитров.
+
+{items_block}
+
+Шкала:
+{_SCALE_DESCRIPTION}
+
+Верни ТОЛЬКО JSON-объект вида {{"scores": [{{"id": 1, "score": 7}}, ...]}} с оценкой для каждого id."""
+
+        try:
+            content = self._complete(
+                prompt,
+                max_tokens=16 * len(pairs) + 16,
+                schema=_GROUP_SCHEMA if self.structured_output else None
+            )
+            return _parse_group_scores(content, len(pairs))
+
+        except Exception as e:
+            print(f"⚠️  {self.name} API error: {e}")
+            return [-1] * len(pairs)
+
+    def evaluate_batch(self, pairs: List[Tuple[str, str]], max_workers: int = 8,
+                       group_size: int = 1,
+                       progress: Optional[Callable[[int], None]] = None) -> List[int]:
+        """
+        Evaluate several (English, Russian) pairs concurrently.
+
+        Requests are network-bound, so threads overlap their latency.
+
+        Args:
+            pairs: List of (en_text, ru_text) tuples
+            max_workers: Maximum number of concurrent requests
+            group_size: Number of pairs sent in each prompt
+            progress: Called with the number of pairs finished by each request
+
+        Returns:
+            Scores in the same order as pairs (-1 for failed evaluations)
+        """
+        def run_group(group: List[Tuple[str, str]]) -> List[int]:
+            # A short last group still uses the grouped prompt, so every pair of a
+            # grouped run is scored (and cached) under the same prompt
+            if group_size == 1:
+                scores = [self.evaluate(*group[0])]
+            else:
+                scores = self.evaluate_group(group)
+            if progress is not None:
+                progress(len(group))
+            return scores
+
+        group_size = max(1, group_size)
+        groups = [pairs[i:i + group_size] for i in range(0, len(pairs), group_size)]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(chain.from_iterable(executor.map(run_group, groups)))
+
+
+class OpenRouterEvaluator(LLMEvaluator):
+    """Evaluator using OpenRouter API."""
+
+    name = "OpenRouter"
+
+    def __init__(self, api_key: str, model: str = "anthropic/claude-3.5-sonnet",
+                 structured_output: bool = False, seed: Optional[int] = None,
+                 pool_size: int = 16):
+        """
+        Initialize OpenRouter evaluator.
+
+        Args:
+            api_key: OpenRouter API key
+            model: Model identifier (default: claude-3.5-sonnet)
+            structured_output: Request JSON-schema constrained replies
+            seed: Sampling seed for reproducible replies
+            pool_size: Kept-alive connections, at least the number of concurrent requests
+        """
+        self.api_key = api_key
+        self.model = model
+        self.structured_output = structured_output
+        self.seed = seed
+        self.base_url = "https://openrouter.ai/api/v1/chat/completions"
+        self._session = _create_session(pool_size)
+
+    def _complete(self, prompt: str, max_tokens: int, schema: Optional[Dict] = None) -> str:
+        """Send a chat completion request to OpenRouter API."""
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+
+        payload = self._build_payload(prompt, max_tokens, schema)
+        result = self._post(headers, payload, timeout=30)
+        return result["choices"][0]["message"]["content"].strip()
+
 
 class LMStudioEvaluator(LLMEvaluator):
     """Evaluator using local LMStudio instance."""
 
+    name = "LMStudio"
+
     def __init__(self, base_url: str = "http://localhost:1234/v1/chat/completions",
-                 model: str = "local-model"):
+                 model: str = "local-model", structured_output: bool = False,
+                 seed: Optional[int] = None, pool_size: int = 16):
         """
         Initialize LMStudio evaluator.
 
         Args:
             base_url: LMStudio API endpoint
             model: Model identifier (typically "local-model" or specific model name)
+            structured_output: Request JSON-schema constrained replies
+            seed: Sampling seed for reproducible replies
+            pool_size: Kept-alive connections, at least the number of concurrent requests
         """
         self.base_url = base_url
         self.model = model
+        self.structured_output = structured_output
+        self.seed = seed
+        self._session = _create_session(pool_size)
 
-    def evaluate(self, en_text: str, ru_text: str) -> int:
-        """Evaluate using LMStudio local API."""
-        import requests
+    def _complete(self, prompt: str, max_tokens: int, schema: Optional[Dict] = None) -> str:
+        """Send a chat completion request to LMStudio local API."""
+        headers = {
+            "Content-Type": "application/json"
+        }
 
-        prompt = f"""Оцени по шкале от 1 до 10, насколько хорошо русский перевод соответствует английскому тексту из субтитров.
+        payload = self._build_payload(prompt, max_tokens, schema)
+        result = self._post(headers, payload, timeout=60)
+        return result["choices"][0]["message"]["content"].strip()
 
-Английский текст: "{en_text}"
-Русский текст: "{ru_text}"
 
-Верни ТОЛЬКО число от 1 до 10, где:
-- 1-3: Плохое соответствие (смысл полностью искажен или тексты не связаны)
-- 4-6: Среднее соответствие (общий смысл передан, но есть заметные расхождения)
-- 7-9: Хорошее соответствие (точный перевод с небольшими различиями)
-- 10: Отличное соответствие (практически идеальный перевод)
+class CachedEvaluator(LLMEvaluator):
+    """Evaluator wrapper that stores successful scores in a SQLite database."""
 
-Ответ (только число):"""
+    # Number of new rows written between commits
+    COMMIT_EVERY = 100
 
-        headers = {
-            "Content-Type": "application/json"
-        }
+    def __init__(self, evaluator: LLMEvaluator, cache_path: str):
+        """
+        Initialize cached evaluator.
 
-        payload = {
-            "model": self.model,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "temperature": 0.3,
-            "max_tokens": 10
-        }
+        Args:
+            evaluator: Evaluator used for pairs missing from the cache
+            cache_path: Path to the SQLite cache file
+        """
+        self.evaluator = evaluator
+        self.name = evaluator.name
+        self.model = getattr(evaluator, "model", "")
+        self.seed = evaluator.seed
+        self.base_url = getattr(evaluator, "base_url", "")
+        self.structured_output = evaluator.structured_output
+
+        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(cache_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS scores "
+            "(key TEXT PRIMARY KEY, score INTEGER, model TEXT)"
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    def _key(self, en_text: str, ru_text: str, grouped: bool = False) -> str:
+        """
+        Build the cache key for a pair.
 
-        try:
-            response = requests.post(
-                self.base_url,
-                headers=headers,
-                json=payload,
-                timeout=60
+        The key covers everything that changes the score: provider, endpoint,
+        model, seed and prompt mode (single or grouped, free text or JSON schema).
+        """
+        mode = ("group" if grouped else "single") + ("+json" if self.structured_output else "")
+        return hashlib.sha256(
+            f"{self.name}\0{self.base_url}\0{self.model}\0{self.seed}\0{mode}\0"
+            f"{en_text}\0{ru_text}".encode()
+        ).hexdigest()
+
+    def _lookup(self, keys: List[str]) -> Dict[str, int]:
+        """Return cached scores for the given keys."""
+        found = {}
+        with self._lock:
+            for key in keys:
+                row = self._conn.execute(
+                    "SELECT score FROM scores WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    found[key] = row[0]
+        return found
+
+    def _store(self, rows: List[Tuple[str, int]]):
+        """Insert successful scores, committing every COMMIT_EVERY rows."""
+        rows = [(key, score, self.model) for key, score in rows if score > 0]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO scores (key, score, model) VALUES (?, ?, ?)", rows
             )
-            response.raise_for_status()
-
-            result = response.json()
-            content = result["choices"][0]["message"]["content"].strip()
+            self._pending += len(rows)
+            if self._pending >= self.COMMIT_EVERY:
+                self._conn.commit()
+                self._pending = 0
 
-            # Extract number from response
-            score = int(''.join(filter(str.isdigit, content))[:2])
-            return max(1, min(10, score))  # Clamp to 1-10
-
-        except Exception as e:
-            print(f"⚠️  LMStudio API error: {e}")
-            return -1
+    def evaluate(self, en_text: str, ru_text: str) -> int:
+        """Return the cached score or evaluate the pair and cache it."""
+        key = self._key(en_text, ru_text)
+        cached = self._lookup([key])
+        if key in cached:
+            return cached[key]
+
+        score = self.evaluator.evaluate(en_text, ru_text)
+        self._store([(key, score)])
+        return score
+
+    def evaluate_batch(self, pairs: List[Tuple[str, str]], max_workers: int = 8,
+                       group_size: int = 1,
+                       progress: Optional[Callable[[int], None]] = None) -> List[int]:
+        """Evaluate only the pairs missing from the cache, keeping pair order."""
+        keys = [self._key(en_text, ru_text, grouped=group_size > 1) for en_text, ru_text in pairs]
+        cached = self._lookup(keys)
+
+        missing = [i for i, key in enumerate(keys) if key not in cached]
+        if progress is not None and len(missing) < len(keys):
+            progress(len(keys) - len(missing))
+        fresh = self.evaluator.evaluate_batch(
+            [pairs[i] for i in missing], max_workers, group_size, progress
+        ) if missing else []
+        self._store([(keys[i], score) for i, score in zip(missing, fresh)])
+
+        scores = [cached.get(key, -1) for key in keys]
+        for i, score in zip(missing, fresh):
+            scores[i] = score
+        return scores
+
+    def close(self):
+        """Commit pending rows and close the database."""
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
 
 
 # ============================================================================
 # Main Evaluation Logic
 # ============================================================================
 
-def create_subtitle_pairs(en_path: str, ru_path: str) -> List[Dict[str, str]]:
+def create_subtitle_pairs(en_path: str, ru_path: str) -> List[Tuple[Cue, Cue]]:
     """
-    Parse subtitle files and create list of {'en': ..., 'ru': ...} dictionaries.
+    Parse subtitle files and create list of matched (English, Russian) cue pairs.
 
     Uses the same logic as file upload process in SubReverse.
 
@@ -196,7 +576,7 @@ def create_subtitle_pairs(en_path: str, ru_path: str) -> List[Dict[str, str]]:
         ru_path: Path to Russian .srt file
 
     Returns:
-        List of subtitle pair dictionaries
+        List of (en_cue, ru_cue) tuples
     """
     print(f"📄 Parsing English subtitles: {en_path}")
     en_cues = parse_srt(en_path)
@@ -210,29 +590,49 @@ def create_subtitle_pairs(en_path: str, ru_path: str) -> List[Dict[str, str]]:
     matched_pairs = match_cues(en_cues, ru_cues, tolerance_ms=1000)
     print(f"   Matched {len(matched_pairs)} pairs")
 
-    # Convert to dictionary format
-    result = []
-    for en_cue, ru_cue in matched_pairs:
-        if ru_cue:  # Only include pairs with both languages
-            result.append({
-                'en': en_cue.text,
-                'ru': ru_cue.text
-            })
+    # Only include pairs with both languages; texts are read later for sampled pairs only
+    result = [pair for pair in matched_pairs if pair[1] is not None]
 
     print(f"✅ Created {len(result)} complete pairs\n")
     return result
 
 
-def evaluate_pairs(pairs: List[Dict[str, str]],
+def _truncate(text: str, limit: int = 80) -> str:
+    """Shorten text for preview output, marking cut text with '...'."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _cheap_score(en_text: str, ru_text: str) -> Optional[int]:
+    """
+    Score structurally trivial pairs without the LLM.
+
+    Only pairs whose texts are the same digits once punctuation and whitespace
+    are ignored ("1984" / "1984!") are a sure match. Texts with letters always go
+    to the LLM: an identical line on both sides may be an untranslated one.
+
+    Returns:
+        10 for trivial pairs, None if the pair needs an LLM evaluation
+    """
+    en_digits = _NON_WORD_RE.sub('', en_text)
+    if en_digits and en_digits.isdigit() and en_digits == _NON_WORD_RE.sub('', ru_text):
+        return 10
+    return None
+
+
+def evaluate_pairs(pairs: List[Tuple[Cue, Cue]],
                    count: int,
-                   evaluator: LLMEvaluator) -> Tuple[List[int], float]:
+                   evaluator: LLMEvaluator,
+                   workers: int = 8,
+                   batch_size: int = 1) -> Tuple[List[int], float]:
     """
     Randomly select and evaluate N subtitle pairs.
 
     Args:
-        pairs: List of subtitle pair dictionaries
+        pairs: List of matched (en_cue, ru_cue) tuples
         count: Number of pairs to evaluate
         evaluator: LLM evaluator instance
+        workers: Number of concurrent evaluation requests
+        batch_size: Number of pairs sent to the LLM in each request
 
     Returns:
         Tuple of (list of scores, average score)
@@ -242,18 +642,34 @@ def evaluate_pairs(pairs: List[Dict[str, str]],
         count = len(pairs)
 
     print(f"🎲 Randomly selecting {count} pairs for evaluation...\n")
-    selected = random.sample(pairs, count)
+    selected = [(en_cue.text, ru_cue.text) for en_cue, ru_cue in random.sample(pairs, count)]
 
-    scores = []
-    valid_scores = []
+    # Trivial pairs are scored locally; only the rest are sent to the LLM
+    cheap_scores = [_cheap_score(en_text, ru_text) for en_text, ru_text in selected]
+    pending = [pair for pair, score in zip(selected, cheap_scores) if score is None]
 
-    for i, pair in enumerate(selected, 1):
-        print(f"[{i}/{count}] Evaluating pair:")
-        print(f"   EN: {pair['en'][:80]}{'...' if len(pair['en']) > 80 else ''}")
-        print(f"   RU: {pair['ru'][:80]}{'...' if len(pair['ru']) > 80 else ''}")
+    progress_bar = tqdm(total=count, unit="pair", file=sys.stderr) if tqdm else None
+    if progress_bar:
+        progress_bar.update(count - len(pending))
+    try:
+        llm_scores = evaluator.evaluate_batch(
+            pending,
+            max_workers=workers,
+            group_size=batch_size,
+            progress=progress_bar.update if progress_bar else None
+        )
+    finally:
+        if progress_bar:
+            progress_bar.close()
+
+    llm_scores = iter(llm_scores)
+    scores = [next(llm_scores) if score is None else score for score in cheap_scores]
+    valid_scores = []
 
-        score = evaluator.evaluate(pair['en'], pair['ru'])
-        scores.append(score)
+    for i, ((en_text, ru_text), score) in enumerate(zip(selected, scores), 1):
+        print(f"[{i}/{count}] Evaluated pair:")
+        print(f"   EN: {_truncate(en_text)}")
+        print(f"   RU: {_truncate(ru_text)}")
 
         if score > 0:
             valid_scores.append(score)
@@ -365,6 +781,39 @@ Examples:
         type=int,
         help="Random seed for reproducible sampling"
     )
+    parser.add_argument(
+        "--llm-seed",
+        type=int,
+        default=0,
+        help="Seed sent to the LLM for reproducible scores (default: 0)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Number of concurrent evaluation requests (default: 8)"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Number of pairs scored in a single LLM request (default: 1)"
+    )
+    parser.add_argument(
+        "--cache-path",
+        default=str(Path.home() / ".cache" / "subreverse" / "eval.db"),
+        help="SQLite file caching scores by model and pair text (default: ~/.cache/subreverse/eval.db)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the LLM, without reading or writing the score cache"
+    )
+    parser.add_argument(
+        "--structured-output",
+        action="store_true",
+        help="Constrain LLM replies with a JSON schema (needs provider/model support)"
+    )
 
     args = parser.parse_args()
 
@@ -381,13 +830,22 @@ Examples:
         print(f"❌ Error: Count must be positive, got: {args.count}")
         sys.exit(1)
 
+    if args.workers <= 0:
+        print(f"❌ Error: Workers must be positive, got: {args.workers}")
+        sys.exit(1)
+
+    if args.batch_size <= 0:
+        print(f"❌ Error: Batch size must be positive, got: {args.batch_size}")
+        sys.exit(1)
+
     # Set random seed if provided
     if args.seed is not None:
         random.seed(args.seed)
         print(f"🎲 Using random seed: {args.seed}\n")
 
-    # Create evaluator
+    # Create evaluator; one pooled connection per concurrent worker
     print(f"🤖 Initializing {args.provider.upper()} evaluator...")
+    pool_size = max(16, args.workers)
 
     if args.provider == "openrouter":
         api_key = args.api_key or os.getenv("OPENROUTER_API_KEY")
@@ -397,15 +855,23 @@ Examples:
             sys.exit(1)
 
         model = args.model or "anthropic/claude-3.5-sonnet"
-        evaluator = OpenRouterEvaluator(api_key, model)
+        evaluator = OpenRouterEvaluator(api_key, model, args.structured_output, args.llm_seed,
+                                        pool_size)
         print(f"   Model: {model}\n")
 
     else:  # lmstudio
         model = args.model or "local-model"
-        evaluator = LMStudioEvaluator(args.lmstudio_url, model)
+        evaluator = LMStudioEvaluator(args.lmstudio_url, model, args.structured_output,
+                                      args.llm_seed, pool_size)
         print(f"   Endpoint: {args.lmstudio_url}")
         print(f"   Model: {model}\n")
 
+    # "local-model" names whatever LMStudio has loaded, so its scores cannot be keyed
+    if args.provider == "lmstudio" and model == "local-model" and not args.no_cache:
+        print("ℹ️  Score cache disabled: pass --model with the loaded model name to enable it\n")
+    elif not args.no_cache:
+        evaluator = CachedEvaluator(evaluator, args.cache_path)
+
     # Parse subtitle files
     try:
         pairs = create_subtitle_pairs(args.en_file, args.ru_file)
@@ -419,7 +885,12 @@ Examples:
 
     # Evaluate pairs
     print(f"🚀 Starting evaluation of {args.count} pairs...\n")
-    scores, avg_score = evaluate_pairs(pairs, args.count, evaluator)
+    try:
+        scores, avg_score = evaluate_pairs(pairs, args.count, evaluator,
+                                           args.workers, args.batch_size)
+    finally:
+        if isinstance(evaluator, CachedEvaluator):
+            evaluator.close()
 
     # Print results
     print_results(scores, avg_score)